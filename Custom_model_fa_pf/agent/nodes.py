@@ -23,6 +23,7 @@ from Custom_model_fa_pf.config import (
     AGENT_MAX_TOKENS,
     SUMMARIZE_AFTER_TURNS,
 )
+from Custom_model_fa_pf.entity_schema import SubmissionDict
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +119,7 @@ _FLAT_MAP_PRIOR = {
 
 
 def flatten_entities_to_form_state(
-    entities: dict, source: str = "extracted"
+    entities: SubmissionDict, source: str = "extracted"
 ) -> dict[str, dict]:
     """Flatten nested entity dict into flat form_state entries.
 
@@ -593,10 +594,11 @@ def validate_node(state: IntakeState) -> dict:
     # Apply auto-corrections back to form_state
     updated_state = dict(form_state)
     for field_name, corrected_value in result.auto_corrections.items():
-        if field_name in updated_state:
+        entry = updated_state.get(field_name)
+        if entry is not None:
             updated_state[field_name] = {
-                **updated_state[field_name],
-                "value": result.corrected_values.get(field_name, updated_state[field_name].get("value")),
+                **entry,
+                "value": result.corrected_values.get(field_name, entry.get("value")),
                 "status": "confirmed",
             }
 
@@ -6,6 +6,8 @@ from typing import Annotated, Optional, TypedDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+from Custom_model_fa_pf.entity_schema import SubmissionDict
+
 
 class IntakePhase(str, Enum):
     """Phases of the insurance intake conversation."""
@@ -49,7 +51,7 @@ class IntakeState(TypedDict):
     # Intake progress
     phase: str  # IntakePhase value (stored as str for serialization)
     form_state: dict  # field_name -> {value, confidence, source, status}
-    entities: dict  # Structured extracted entities (CustomerSubmission.to_dict())
+    entities: SubmissionDict  # Structured extracted entities (CustomerSubmission.to_dict())
 
     # Forms
     lobs: list  # LOB IDs (e.g., ["commercial_auto", "general_liability"])
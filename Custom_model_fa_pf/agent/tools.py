@@ -177,9 +177,11 @@ def read_form(pdf_path: str) -> str:
         pdf_path: Path to the PDF file to read
     """
     from pathlib import Path
-    from Custom_model_fa_pf.form_reader import read_pdf_form
+    from Custom_model_fa_pf.form_reader import read_form_catalog
 
-    catalog = read_pdf_form(Path(pdf_path))
+    # Bounded LRU per file version: the agent re-reads the same forms across
+    # turns, but any path (uploads, temp files) can arrive here.
+    catalog = read_form_catalog(Path(pdf_path))
     summary = {
         "form_number": catalog.form_number,
         "total_fields": catalog.total_fields,
@@ -203,7 +205,7 @@ def map_fields(form_number: str, entities_json: str) -> str:
         entities_json: JSON string of extracted entities (CustomerSubmission format)
     """
     from Custom_model_fa_pf.entity_schema import CustomerSubmission
-    from Custom_model_fa_pf.form_reader import find_template, read_pdf_form
+    from Custom_model_fa_pf.form_reader import find_template, read_template_catalog
     from Custom_model_fa_pf import llm_field_mapper
     from Custom_model_fa_pf.agent._llm_provider import get_llm_engine
 
@@ -219,7 +221,7 @@ def map_fields(form_number: str, entities_json: str) -> str:
         return json.dumps({"error": f"No template found for form {form_number}"})
 
     try:
-        catalog = read_pdf_form(template_path)
+        catalog = read_template_catalog(template_path)
         llm = get_llm_engine()
 
         result = llm_field_mapper.map_fields(
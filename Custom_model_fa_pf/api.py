@@ -73,10 +73,18 @@ def _get_knowledge_store():
     return _knowledge_store
 
 
+def _warm_up() -> None:
+    """Parse every ACORD schema now so no request pays the first-load cost."""
+    registry = _get_schema_registry()
+    if registry is not None:
+        registry.load_all()
+
+
 # ---------- Lifespan ----------
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Form Assignment API starting up")
+    _warm_up()
     yield
     logger.info("Form Assignment API shutting down")
 
@@ -1,5 +1,6 @@
 """Configuration and path setup for the Form Assignment & Pre-Filling module."""
 
+import os
 import sys
 from pathlib import Path
 
@@ -19,6 +20,10 @@ DEFAULT_OLLAMA_URL = "http://localhost:11434"
 DEFAULT_CONFIDENCE_THRESHOLD = 0.7
 DEFAULT_TIMEOUT = 300
 DEFAULT_MAX_TOKENS = 4096
+# Concurrent Phase 3 field-mapping LLM calls; 1 sends batches one at a time.
+# Raise only if the LLM server handles parallel requests (e.g. vLLM, or Ollama
+# with OLLAMA_NUM_PARALLEL > 1).
+LLM_MAX_WORKERS = int(os.environ.get("FIELD_MAPPER_LLM_WORKERS", "1"))
 
 # --- Agent configuration ---
 LLM_BACKEND = "ollama"  # "vllm" or "ollama"
@@ -1,7 +1,7 @@
 """Data models for structured entities extracted from customer emails."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TypedDict
 
 # Valid entity_type values for normalization
 _ENTITY_TYPE_MAP = {
@@ -31,6 +31,11 @@ def _normalize_entity_type(val: Optional[str]) -> Optional[str]:
     return _ENTITY_TYPE_MAP.get(key, val.strip().lower())
 
 
+def _field_items(obj):
+    """Yield (name, value) for each field of a slotted entity dataclass."""
+    return ((k, getattr(obj, k)) for k in obj.__slots__)
+
+
 def _str_or_none(val) -> Optional[str]:
     """Convert a value to string, returning None for None/empty."""
     if val is None:
@@ -39,7 +44,7 @@ def _str_or_none(val) -> Optional[str]:
     return s if s else None
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     line_one: Optional[str] = None
     line_two: Optional[str] = None
@@ -48,7 +53,7 @@ class Address:
     zip_code: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data) -> Optional["Address"]:
@@ -68,7 +73,7 @@ class Address:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     full_name: Optional[str] = None
     phone: Optional[str] = None
@@ -76,7 +81,7 @@ class Contact:
     role: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> Optional["Contact"]:
@@ -90,7 +95,7 @@ class Contact:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessInfo:
     business_name: Optional[str] = None
     dba: Optional[str] = None
@@ -113,7 +118,7 @@ class BusinessInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if k == "mailing_address" and v:
@@ -151,7 +156,7 @@ class BusinessInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProducerInfo:
     agency_name: Optional[str] = None
     contact_name: Optional[str] = None
@@ -164,7 +169,7 @@ class ProducerInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if k == "mailing_address" and v:
@@ -189,7 +194,7 @@ class ProducerInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyInfo:
     policy_number: Optional[str] = None
     effective_date: Optional[str] = None
@@ -201,7 +206,7 @@ class PolicyInfo:
     estimated_premium: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> Optional["PolicyInfo"]:
@@ -219,7 +224,7 @@ class PolicyInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleInfo:
     vin: Optional[str] = None
     year: Optional[str] = None
@@ -240,7 +245,7 @@ class VehicleInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if k == "garaging_address" and v:
@@ -273,7 +278,7 @@ class VehicleInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DriverInfo:
     full_name: Optional[str] = None
     first_name: Optional[str] = None
@@ -313,7 +318,7 @@ class DriverInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if k == "mailing_address" and v:
@@ -347,7 +352,7 @@ class DriverInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageRequest:
     lob: Optional[str] = None
     coverage_type: Optional[str] = None
@@ -360,7 +365,7 @@ class CoverageRequest:
     symbol: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> Optional["CoverageRequest"]:
@@ -379,7 +384,7 @@ class CoverageRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationInfo:
     address: Optional[Address] = None
     building_area: Optional[str] = None
@@ -389,7 +394,7 @@ class LocationInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if k == "address" and v:
@@ -411,7 +416,7 @@ class LocationInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LossHistoryEntry:
     date: Optional[str] = None
     lob: Optional[str] = None
@@ -420,7 +425,7 @@ class LossHistoryEntry:
     claim_status: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> Optional["LossHistoryEntry"]:
@@ -435,7 +440,7 @@ class LossHistoryEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalInterest:
     """Additional interest / lienholder / mortgagee on a policy."""
     name: Optional[str] = None
@@ -446,7 +451,7 @@ class AdditionalInterest:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None or v is False:
                 continue
             if k == "address" and v:
@@ -468,7 +473,7 @@ class AdditionalInterest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorInsurance:
     """Prior insurance carrier information."""
     carrier_name: Optional[str] = None
@@ -479,7 +484,7 @@ class PriorInsurance:
     lob: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> Optional["PriorInsurance"]:
@@ -495,7 +500,7 @@ class PriorInsurance:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CyberInfo:
     """Cyber / privacy liability specific information."""
     annual_revenue: Optional[str] = None
@@ -508,7 +513,7 @@ class CyberInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         d = {}
-        for k, v in self.__dict__.items():
+        for k, v in _field_items(self):
             if v is None:
                 continue
             if isinstance(v, list) and not v:
@@ -531,7 +536,7 @@ class CyberInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerSubmission:
     """Top-level container for all extracted entities from a customer email."""
 
@@ -548,7 +553,7 @@ class CustomerSubmission:
     cyber_info: Optional[CyberInfo] = None
     raw_email: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> "SubmissionDict":
         d = {}
         if self.business:
             d["business"] = self.business.to_dict()
@@ -599,3 +604,179 @@ class CustomerSubmission:
             prior_insurance=[pi for pi in prior_insurance if pi],
             cyber_info=CyberInfo.from_dict(data.get("cyber_info")),
         )
+
+
+# ---------------------------------------------------------------------------
+# Plain-dict shapes
+# ---------------------------------------------------------------------------
+# TypedDict mirrors of the dataclasses above, for code that only passes the
+# JSON around (LLM output, agent state, tool payloads) and never needs the
+# normalising from_dict() step. Same keys as to_dict() output; every key is
+# optional because the LLM and to_dict() both omit empty fields.
+
+
+class AddressDict(TypedDict, total=False):
+    line_one: Optional[str]
+    line_two: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    zip_code: Optional[str]
+
+
+class ContactDict(TypedDict, total=False):
+    full_name: Optional[str]
+    phone: Optional[str]
+    email: Optional[str]
+    role: Optional[str]
+
+
+class BusinessInfoDict(TypedDict, total=False):
+    business_name: Optional[str]
+    dba: Optional[str]
+    mailing_address: Optional[AddressDict]
+    tax_id: Optional[str]
+    naics: Optional[str]
+    sic: Optional[str]
+    entity_type: Optional[str]
+    operations_description: Optional[str]
+    annual_revenue: Optional[str]
+    employee_count: Optional[str]
+    years_in_business: Optional[str]
+    website: Optional[str]
+    business_start_date: Optional[str]
+    contacts: List[ContactDict]
+    nature_of_business: Optional[str]
+    part_time_employees: Optional[str]
+    annual_payroll: Optional[str]
+    subcontractor_cost: Optional[str]
+
+
+class ProducerInfoDict(TypedDict, total=False):
+    agency_name: Optional[str]
+    contact_name: Optional[str]
+    phone: Optional[str]
+    fax: Optional[str]
+    email: Optional[str]
+    mailing_address: Optional[AddressDict]
+    producer_code: Optional[str]
+    license_number: Optional[str]
+
+
+class PolicyInfoDict(TypedDict, total=False):
+    policy_number: Optional[str]
+    effective_date: Optional[str]
+    expiration_date: Optional[str]
+    status: Optional[str]
+    billing_plan: Optional[str]
+    payment_plan: Optional[str]
+    deposit_amount: Optional[str]
+    estimated_premium: Optional[str]
+
+
+class VehicleInfoDict(TypedDict, total=False):
+    vin: Optional[str]
+    year: Optional[str]
+    make: Optional[str]
+    model: Optional[str]
+    body_type: Optional[str]
+    gvw: Optional[str]
+    cost_new: Optional[str]
+    garaging_address: Optional[AddressDict]
+    use_type: Optional[str]
+    radius_of_travel: Optional[str]
+    farthest_zone: Optional[str]
+    territory: Optional[str]
+    class_code: Optional[str]
+    stated_amount: Optional[str]
+    deductible_collision: Optional[str]
+    deductible_comprehensive: Optional[str]
+
+
+class DriverInfoDict(TypedDict, total=False):
+    full_name: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    middle_initial: Optional[str]
+    dob: Optional[str]
+    sex: Optional[str]
+    marital_status: Optional[str]
+    license_number: Optional[str]
+    license_state: Optional[str]
+    years_experience: Optional[str]
+    hire_date: Optional[str]
+    mailing_address: Optional[AddressDict]
+    licensed_year: Optional[str]
+    occupation: Optional[str]
+    relationship: Optional[str]
+    vehicle_assigned: Optional[str]
+    pct_use: Optional[str]
+
+
+class CoverageRequestDict(TypedDict, total=False):
+    lob: Optional[str]
+    coverage_type: Optional[str]
+    limit: Optional[str]
+    deductible: Optional[str]
+    per_person_limit: Optional[str]
+    per_accident_limit: Optional[str]
+    aggregate_limit: Optional[str]
+    premium: Optional[str]
+    symbol: Optional[str]
+
+
+class LocationInfoDict(TypedDict, total=False):
+    address: Optional[AddressDict]
+    building_area: Optional[str]
+    construction_type: Optional[str]
+    year_built: Optional[str]
+    occupancy: Optional[str]
+
+
+class LossHistoryEntryDict(TypedDict, total=False):
+    date: Optional[str]
+    lob: Optional[str]
+    description: Optional[str]
+    amount: Optional[str]
+    claim_status: Optional[str]
+
+
+class AdditionalInterestDict(TypedDict, total=False):
+    name: Optional[str]
+    address: Optional[AddressDict]
+    interest_type: Optional[str]
+    account_number: Optional[str]
+    certificate_required: bool
+
+
+class PriorInsuranceDict(TypedDict, total=False):
+    carrier_name: Optional[str]
+    policy_number: Optional[str]
+    effective_date: Optional[str]
+    expiration_date: Optional[str]
+    premium: Optional[str]
+    lob: Optional[str]
+
+
+class CyberInfoDict(TypedDict, total=False):
+    annual_revenue: Optional[str]
+    records_count: Optional[str]
+    has_encryption: Optional[bool]
+    has_mfa: Optional[bool]
+    has_incident_response_plan: Optional[bool]
+    prior_breaches: Optional[str]
+    data_types: List[str]
+
+
+class SubmissionDict(TypedDict, total=False):
+    """CustomerSubmission.to_dict() / extraction LLM output."""
+    business: Optional[BusinessInfoDict]
+    producer: Optional[ProducerInfoDict]
+    policy: Optional[PolicyInfoDict]
+    vehicles: List[VehicleInfoDict]
+    drivers: List[DriverInfoDict]
+    coverages: List[CoverageRequestDict]
+    locations: List[LocationInfoDict]
+    loss_history: List[LossHistoryEntryDict]
+    additional_interests: List[AdditionalInterestDict]
+    prior_insurance: List[PriorInsuranceDict]
+    cyber_info: Optional[CyberInfoDict]
@@ -1,7 +1,9 @@
 """Stage 4: Map extracted entities to ACORD form field name/value pairs."""
 
+import importlib
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from Custom_model_fa_pf.entity_schema import CustomerSubmission
@@ -10,17 +12,22 @@ from Custom_model_fa_pf.lob_rules import LOB_DEFINITIONS, AVAILABLE_SCHEMAS
 
 logger = logging.getLogger(__name__)
 
-# Import field map modules
-from Custom_model_fa_pf.field_maps import form_125, form_127, form_137, form_163
-
+# Form number -> field map module, imported the first time that form is mapped
 FIELD_MAP_MODULES = {
-    "125": form_125,
-    "127": form_127,
-    "137": form_137,
-    "163": form_163,
+    "125": "Custom_model_fa_pf.field_maps.form_125",
+    "127": "Custom_model_fa_pf.field_maps.form_127",
+    "137": "Custom_model_fa_pf.field_maps.form_137",
+    "163": "Custom_model_fa_pf.field_maps.form_163",
 }
 
 
+@lru_cache(maxsize=None)
+def _field_map_module(form_num: str):
+    """Field map module for a form number, or None if there is none."""
+    module_path = FIELD_MAP_MODULES.get(form_num)
+    return importlib.import_module(module_path) if module_path else None
+
+
 def map_all(
     submission: CustomerSubmission,
     assignments: List[FormAssignment],
@@ -54,7 +61,7 @@ def map_all(
             logger.info(f"Form {form_num}: no schema available, skipping field mapping")
             continue
 
-        mapper = FIELD_MAP_MODULES.get(form_num)
+        mapper = _field_map_module(form_num)
         if not mapper:
             logger.warning(f"Form {form_num}: no field map module found")
             continue
@@ -73,16 +80,16 @@ def map_all(
         # Validate field names against schema if available
         if schema_registry:
             validated = schema_registry.validate_field_names(form_num, fields)
-            invalid = set(fields.keys()) - set(validated.keys())
-            if invalid:
+            if len(validated) != len(fields):
+                invalid = fields.keys() - validated.keys()
                 logger.warning(
                     f"Form {form_num}: {len(invalid)} invalid field names removed: "
                     f"{sorted(invalid)[:5]}{'...' if len(invalid) > 5 else ''}"
                 )
             fields = validated
 
-        # Remove empty/None values
-        fields = {k: str(v) for k, v in fields.items() if v is not None and str(v).strip()}
+        # Remove empty/None values (each value stringified once)
+        fields = {k: sv for k, v in fields.items() if v is not None and (sv := str(v)).strip()}
 
         all_mappings[form_num] = fields
         logger.info(f"Form {form_num}: mapped {len(fields)} fields")
@@ -39,6 +39,15 @@ BUSINESS_TYPE_CHECKBOXES = {
     "condominiums": "BusinessInformation_BusinessType_CondominiumsIndicator_A",
 }
 
+# Additional interest type → indicator base name (the _A/_B suffix is appended per interest)
+INTEREST_TYPE_CHECKBOXES = {
+    "additional_insured": "AdditionalInterest_Interest_AdditionalInsuredIndicator",
+    "mortgagee": "AdditionalInterest_Interest_MortgageeIndicator",
+    "lienholder": "AdditionalInterest_Interest_LienholderIndicator",
+    "loss_payee": "AdditionalInterest_Interest_LossPayeeIndicator",
+    "lenders_loss_payable": "AdditionalInterest_Interest_LendersLossPayableIndicator",
+}
+
 LOCATION_SUFFIXES = ["_A", "_B", "_C", "_D"]
 
 
@@ -257,16 +266,9 @@ def map_fields(submission: CustomerSubmission, lob_checkboxes: list[str] | None
                 if ai.address.zip_code:
                     fields[f"AdditionalInterest_MailingAddress_PostalCode{sfx}"] = ai.address.zip_code
             if ai.interest_type:
-                it = ai.interest_type.lower()
-                type_map = {
-                    "additional_insured": f"AdditionalInterest_Interest_AdditionalInsuredIndicator{sfx}",
-                    "mortgagee": f"AdditionalInterest_Interest_MortgageeIndicator{sfx}",
-                    "lienholder": f"AdditionalInterest_Interest_LienholderIndicator{sfx}",
-                    "loss_payee": f"AdditionalInterest_Interest_LossPayeeIndicator{sfx}",
-                    "lenders_loss_payable": f"AdditionalInterest_Interest_LendersLossPayableIndicator{sfx}",
-                }
-                if it in type_map:
-                    fields[type_map[it]] = "1"
+                type_base = INTEREST_TYPE_CHECKBOXES.get(ai.interest_type.lower())
+                if type_base:
+                    fields[f"{type_base}{sfx}"] = "1"
             if ai.account_number:
                 fields[f"AdditionalInterest_AccountNumberIdentifier{sfx}"] = ai.account_number
             if ai.certificate_required:
@@ -20,6 +20,7 @@ Field layout per driver row:
 Driver 1 starts at Text15[0], each subsequent driver increments by 20.
 """
 
+import sys
 from typing import Dict, List
 from Custom_model_fa_pf.entity_schema import CustomerSubmission
 
@@ -57,12 +58,13 @@ def _build_row_map() -> List[Dict[str, str]]:
     rows = []
     for row_idx in range(MAX_DRIVERS):
         base = _BASE_FIELD + row_idx * _FIELDS_PER_ROW
-        row = {col: f"Text{base + offset}[0]" for col, offset in _COL_OFFSETS.items()}
+        # Interned: the same names are the PDF catalog's keys (form_reader)
+        row = {col: sys.intern(f"Text{base + offset}[0]") for col, offset in _COL_OFFSETS.items()}
         # Marital status is a separate field series
         if row_idx == 0:
             row["marital_status"] = "marital[0]"
         else:
-            row["marital_status"] = f"maritalstatus{row_idx}[0]"
+            row["marital_status"] = sys.intern(f"maritalstatus{row_idx}[0]")
         rows.append(row)
     return rows
 
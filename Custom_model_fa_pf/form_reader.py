@@ -7,7 +7,9 @@ and suffix indices for array fields.
 
 import logging
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -57,9 +59,12 @@ _FORM_SIGNATURES = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FormField:
-    """A single form field extracted from the PDF."""
+    """A single form field extracted from the PDF (slotted: one per widget).
+
+    Frozen so cached catalogs can be shared safely and fields can key caches.
+    """
     name: str
     field_type: str  # text, checkbox, radio, dropdown, signature, unknown
     tooltip: Optional[str] = None
@@ -85,7 +90,7 @@ class FormField:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSection:
     """A group of related fields."""
     category: str
@@ -164,8 +169,9 @@ def _get_tooltip(doc: fitz.Document, widget) -> Optional[str]:
             if text.startswith("(") and text.endswith(")"):
                 text = text[1:-1]
             # Unescape PDF string
-            text = text.replace("\\(", "(").replace("\\)", ")").replace("\\\\", "\\")
-            return text.strip() if text.strip() else None
+            text = text.replace("\\(", "(").replace("\\)", ")").replace("\\\\", "\\").strip()
+            # Lettered siblings (_A, _B, ...) repeat the same tooltip: keep one copy
+            return sys.intern(text) if text else None
     except Exception:
         pass
     return None
@@ -201,7 +207,7 @@ def _extract_suffix(field_name: str) -> Tuple[Optional[str], Optional[str]]:
     match = _SUFFIX_RE.search(field_name)
     if match:
         suffix = match.group(0)  # e.g. "_A"
-        base_name = field_name[:match.start()]
+        base_name = sys.intern(field_name[:match.start()])
         return suffix, base_name
     return None, None
 
@@ -258,6 +264,7 @@ def read_pdf_form(pdf_path: Path, scale_dpi: int = 300) -> FormCatalog:
                 name = widget.field_name
                 if not name:
                     continue
+                name = sys.intern(name)
 
                 # Deduplicate (same field can appear on multiple pages in some PDFs)
                 if name in catalog.fields:
@@ -339,6 +346,59 @@ def read_pdf_form(pdf_path: Path, scale_dpi: int = 300) -> FormCatalog:
     return catalog
 
 
+# Catalogs of blank template PDFs, keyed by resolved path and checked against
+# (mtime_ns, size): each template is read once per process, not per request.
+_CATALOG_CACHE: Dict[str, Tuple[Tuple[int, int], FormCatalog]] = {}
+
+
+def read_template_catalog(pdf_path: Path) -> FormCatalog:
+    """read_pdf_form() for blank templates, cached per file version.
+
+    Only pass template paths: entries are never evicted; other PDFs go
+    through read_form_catalog(). The returned catalog is shared between
+    callers; treat it as read-only.
+    """
+    pdf_path = Path(pdf_path)
+    try:
+        st = pdf_path.stat()
+    except OSError:
+        return read_pdf_form(pdf_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(pdf_path.resolve())
+    cached = _CATALOG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    catalog = read_pdf_form(pdf_path)
+    if catalog.fields:
+        _CATALOG_CACHE[key] = (stamp, catalog)
+    return catalog
+
+
+# Catalogs of arbitrary PDFs (uploads, agent tool paths), bounded so a
+# long-running process keeps only the most recently read ones.
+FORM_CATALOG_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=FORM_CATALOG_CACHE_SIZE)
+def _read_catalog_version(resolved_path: str, mtime_ns: int, size: int) -> FormCatalog:
+    return read_pdf_form(Path(resolved_path))
+
+
+def read_form_catalog(pdf_path: Path) -> FormCatalog:
+    """read_pdf_form() for any PDF, through a bounded LRU cache.
+
+    Keyed by (resolved path, mtime_ns, size), so an edited file is read
+    again; at most FORM_CATALOG_CACHE_SIZE catalogs are kept. The returned
+    catalog is shared between callers; treat it as read-only.
+    """
+    pdf_path = Path(pdf_path)
+    try:
+        st = pdf_path.stat()
+    except OSError:
+        return read_pdf_form(pdf_path)
+    return _read_catalog_version(str(pdf_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
 def find_template(form_number: str) -> Optional[Path]:
     """Find a blank ACORD template PDF by form number."""
     patterns = [
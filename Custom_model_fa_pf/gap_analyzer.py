@@ -204,8 +204,8 @@ def _build_contextual_questions(
     for path in sorted(critical_paths - asked_fields):
         if len(questions) >= MAX_CRITICAL_QUESTIONS:
             break
-        if path in _FIELD_QUESTIONS:
-            q = _FIELD_QUESTIONS[path]
+        q = _FIELD_QUESTIONS.get(path)
+        if q is not None:
             questions.append(GapQuestion(q.category, "critical", q.question))
             asked_fields.add(path)
 
@@ -213,8 +213,8 @@ def _build_contextual_questions(
     for path in sorted(important_paths - asked_fields):
         if len(questions) >= MAX_CRITICAL_QUESTIONS + MAX_IMPORTANT_QUESTIONS:
             break
-        if path in _FIELD_QUESTIONS:
-            q = _FIELD_QUESTIONS[path]
+        q = _FIELD_QUESTIONS.get(path)
+        if q is not None:
             questions.append(GapQuestion(q.category, "important", q.question))
             asked_fields.add(path)
 
@@ -11,10 +11,14 @@ Phase 3: LLM batch mapping (remaining fields, ~5 calls)
 import json
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from Custom_model_fa_pf.config import LLM_MAX_WORKERS
 from Custom_model_fa_pf.entity_schema import CustomerSubmission
 from Custom_model_fa_pf.form_reader import FormCatalog, FormField
 from Custom_model_fa_pf.prompts import FIELD_MAPPING_SYSTEM, FIELD_MAPPING_PROMPT
@@ -137,6 +141,32 @@ CHECKBOX_ENTITY_MAP: List[Tuple[str, str, str]] = [
     (r"CertificateRequiredIndicator", "_cert_required", "true"),
 ]
 
+_DETERMINISTIC_RES = [(re.compile(p), path) for p, path in DETERMINISTIC_PATTERNS]
+_CHECKBOX_RES = [(re.compile(p), path, value) for p, path, value in CHECKBOX_ENTITY_MAP]
+
+
+@lru_cache(maxsize=None)
+def _deterministic_path(field_name: str) -> Optional[str]:
+    """Entity path of the first DETERMINISTIC_PATTERNS entry matching a field name.
+
+    Cached: the same PDF field names come back for every submission mapped
+    onto a form, so each name is scanned against the patterns once.
+    """
+    for regex, entity_path in _DETERMINISTIC_RES:
+        if regex.search(field_name):
+            return entity_path
+    return None
+
+
+@lru_cache(maxsize=None)
+def _checkbox_rule(field_name: str) -> Optional[Tuple[str, str]]:
+    """(entity_path, match_value) of the first CHECKBOX_ENTITY_MAP entry matching a field name."""
+    for regex, entity_path, match_value in _CHECKBOX_RES:
+        if regex.search(field_name):
+            return entity_path, match_value
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Phase 2: Suffix-indexed array mapping
 # ---------------------------------------------------------------------------
@@ -146,6 +176,21 @@ SUFFIX_TO_INDEX = {
     "_H": 7, "_I": 8, "_J": 9, "_K": 10, "_L": 11, "_M": 12,
 }
 
+# ACORD address sub-fields → Address attribute, shared by every entity block
+_ADDRESS_PARTS = (
+    ("LineOne", "line_one"),
+    ("CityName", "city"),
+    ("StateOrProvinceCode", "state"),
+    ("PostalCode", "zip_code"),
+)
+
+
+def _address_fields(prefix: str, attr: str) -> Dict[str, str]:
+    """{"<prefix>_LineOne": "<attr>.line_one", ...} for the standard address parts."""
+    # Interned like the literal keys around them (PDF field base names)
+    return {sys.intern(f"{prefix}_{part}"): sys.intern(f"{attr}.{sub}") for part, sub in _ADDRESS_PARTS}
+
+
 # Base field name (without suffix) → attribute on DriverInfo
 # Includes both canonical PDF names (from Form 127) and common aliases.
 _DRIVER_FIELD_MAP = {
@@ -179,10 +224,7 @@ _DRIVER_FIELD_MAP = {
     "Driver_Vehicle_UsePercent": "pct_use",             # actual PDF name
     "Driver_PercentUse": "pct_use",                     # alias
     # Address
-    "Driver_MailingAddress_LineOne": "mailing_address.line_one",
-    "Driver_MailingAddress_CityName": "mailing_address.city",
-    "Driver_MailingAddress_StateOrProvinceCode": "mailing_address.state",
-    "Driver_MailingAddress_PostalCode": "mailing_address.zip_code",
+    **_address_fields("Driver_MailingAddress", "mailing_address"),
 }
 
 # Base field name → attribute on VehicleInfo
@@ -221,22 +263,14 @@ _VEHICLE_FIELD_MAP = {
     # Registration
     "Vehicle_Registration_StateOrProvinceCode": "registration_state",
     # Garaging / physical address
-    "Vehicle_PhysicalAddress_LineOne": "garaging_address.line_one",   # actual PDF name
-    "Vehicle_PhysicalAddress_CityName": "garaging_address.city",     # actual PDF name
-    "Vehicle_PhysicalAddress_StateOrProvinceCode": "garaging_address.state",  # actual
-    "Vehicle_PhysicalAddress_PostalCode": "garaging_address.zip_code",        # actual
+    **_address_fields("Vehicle_PhysicalAddress", "garaging_address"),  # actual PDF name
     "Vehicle_PhysicalAddress_CountyName": "garaging_address.county",
-    "Vehicle_Garaging_CityName": "garaging_address.city",            # alias
-    "Vehicle_Garaging_StateOrProvinceCode": "garaging_address.state",# alias
-    "Vehicle_Garaging_PostalCode": "garaging_address.zip_code",      # alias
+    **_address_fields("Vehicle_Garaging", "garaging_address"),         # alias
 }
 
 # Base field name → attribute on LocationInfo
 _LOCATION_FIELD_MAP = {
-    "Location_Address_LineOne": "address.line_one",
-    "Location_Address_CityName": "address.city",
-    "Location_Address_StateOrProvinceCode": "address.state",
-    "Location_Address_PostalCode": "address.zip_code",
+    **_address_fields("Location_Address", "address"),
     "Location_BuildingArea": "building_area",
     "Location_ConstructionType": "construction_type",
     "Location_YearBuilt": "year_built",
@@ -267,14 +301,8 @@ _LOSS_FIELD_MAP = {
 # Base field name → attribute on AdditionalInterest
 _AI_FIELD_MAP = {
     "AdditionalInterest_FullName": "name",
-    "AdditionalInterest_Address_LineOne": "address.line_one",
-    "AdditionalInterest_Address_CityName": "address.city",
-    "AdditionalInterest_Address_StateOrProvinceCode": "address.state",
-    "AdditionalInterest_Address_PostalCode": "address.zip_code",
-    "AdditionalInterest_MailingAddress_LineOne": "address.line_one",
-    "AdditionalInterest_MailingAddress_CityName": "address.city",
-    "AdditionalInterest_MailingAddress_StateOrProvinceCode": "address.state",
-    "AdditionalInterest_MailingAddress_PostalCode": "address.zip_code",
+    **_address_fields("AdditionalInterest_Address", "address"),
+    **_address_fields("AdditionalInterest_MailingAddress", "address"),
     "AdditionalInterest_MailingAddress_LineTwo": "address.line_two",
     "AdditionalInterest_AccountNumber": "account_number",
     "AdditionalInterest_AccountNumberIdentifier": "account_number",
@@ -298,6 +326,9 @@ _INDEXED_MAPS = [
 # Phase 3: LLM batch size
 # ---------------------------------------------------------------------------
 LLM_BATCH_SIZE = 75
+# Batches are independent (each carries its own field slice), so up to
+# config.LLM_MAX_WORKERS of them may be in flight at once; results are merged
+# back in batch order.
 
 
 @dataclass
@@ -470,6 +501,7 @@ def map_fields(
     catalog: FormCatalog,
     lobs: Optional[List[str]] = None,
     llm_engine=None,
+    max_workers: int = LLM_MAX_WORKERS,
 ) -> MappingResult:
     """Map extracted entities to form fields using 3-phase strategy.
 
@@ -478,6 +510,8 @@ def map_fields(
         catalog: Form catalog from form_reader
         lobs: List of LOB IDs (for checkbox resolution)
         llm_engine: Optional LLMEngine for Phase 3
+        max_workers: Concurrent Phase 3 LLM calls (1 = sequential; default
+            from FIELD_MAPPER_LLM_WORKERS, see config.LLM_MAX_WORKERS)
 
     Returns:
         MappingResult with all mappings and statistics
@@ -496,28 +530,27 @@ def map_fields(
 
     for field_name, form_field in catalog.fields.items():
         # Text field patterns
-        for pattern, entity_path in DETERMINISTIC_PATTERNS:
-            if re.search(pattern, field_name):
-                value = _resolve_entity_path(entities, entity_path)
-                if value:
-                    result.mappings[field_name] = value
-                    mapped_names.add(field_name)
-                    result.phase1_count += 1
-                break
+        entity_path = _deterministic_path(field_name)
+        if entity_path is not None:
+            value = _resolve_entity_path(entities, entity_path)
+            if value:
+                result.mappings[field_name] = value
+                mapped_names.add(field_name)
+                result.phase1_count += 1
 
         # Checkbox patterns (only for checkbox fields)
         if form_field.field_type == "checkbox" and field_name not in mapped_names:
-            for pattern, entity_path, match_value in CHECKBOX_ENTITY_MAP:
-                if re.search(pattern, field_name):
-                    value = _resolve_checkbox(
-                        entities, entity_path, match_value,
-                        lobs=lobs, coverage_types=coverage_types, ai_types=ai_types,
-                    )
-                    if value is not None:
-                        result.mappings[field_name] = value
-                        mapped_names.add(field_name)
-                        result.phase1_count += 1
-                    break
+            rule = _checkbox_rule(field_name)
+            if rule is not None:
+                entity_path, match_value = rule
+                value = _resolve_checkbox(
+                    entities, entity_path, match_value,
+                    lobs=lobs, coverage_types=coverage_types, ai_types=ai_types,
+                )
+                if value is not None:
+                    result.mappings[field_name] = value
+                    mapped_names.add(field_name)
+                    result.phase1_count += 1
 
     logger.info(f"Phase 1: {result.phase1_count} fields mapped")
 
@@ -526,6 +559,10 @@ def map_fields(
     # ---------------------------------------------------------------
     logger.info("Phase 2: Suffix-indexed array mapping")
 
+    # Group the suffixed siblings of each base name (Driver_GivenName_A.._M)
+    # into one (index, field_name) list, so the entity maps are consulted
+    # once per base name rather than once per field.
+    indexed_groups: Dict[str, List[Tuple[int, str]]] = {}
     for field_name, form_field in catalog.fields.items():
         if field_name in mapped_names:
             continue
@@ -545,14 +582,21 @@ def map_fields(
             else:
                 continue
 
-        # Try each indexed map
-        for field_map, list_name in _INDEXED_MAPS:
-            value = _resolve_indexed_field(entities, base_name, index, list_name, field_map)
-            if value:
-                result.mappings[field_name] = value
-                mapped_names.add(field_name)
-                result.phase2_count += 1
-                break
+        indexed_groups.setdefault(base_name, []).append((index, field_name))
+
+    for base_name, members in indexed_groups.items():
+        maps = [(field_map, list_name) for field_map, list_name in _INDEXED_MAPS if base_name in field_map]
+        if not maps:
+            continue
+        for index, field_name in members:
+            # Try each indexed map that knows this base name
+            for field_map, list_name in maps:
+                value = _resolve_indexed_field(entities, base_name, index, list_name, field_map)
+                if value:
+                    result.mappings[field_name] = value
+                    mapped_names.add(field_name)
+                    result.phase2_count += 1
+                    break
 
     logger.info(f"Phase 2: {result.phase2_count} fields mapped")
 
@@ -602,46 +646,49 @@ def map_fields(
     # Batch unmapped fields by category
     batches = _create_batches(unmapped_fields, LLM_BATCH_SIZE)
 
-    for batch_idx, batch in enumerate(batches):
-        try:
-            # Build field list for prompt
-            field_lines = []
-            for f in batch:
-                tooltip_str = f": \"{f.tooltip}\"" if f.tooltip else ""
-                field_lines.append(f"- {f.name} ({f.field_type}){tooltip_str}")
-            field_list = "\n".join(field_lines)
-
-            prompt = FIELD_MAPPING_PROMPT.format(
-                entity_json=entity_json[:6000],  # Truncate if very large
-                field_list=field_list,
-                already_mapped_sample=mapped_sample_str[:2000],
-            )
-
-            response = llm_engine.generate(
-                prompt=prompt,
-                system=FIELD_MAPPING_SYSTEM,
-                temperature=0.0,
-            )
-
-            parsed = llm_engine.parse_json(response)
-            mappings = parsed.get("mappings", {})
-
-            for fname, value in mappings.items():
-                if fname in catalog.fields and value and str(value).strip():
-                    val_str = str(value).strip()
-                    # Skip "null", "N/A", "unknown" etc
-                    if val_str.lower() in ("null", "none", "n/a", "unknown", ""):
-                        continue
-                    result.mappings[fname] = val_str
-                    mapped_names.add(fname)
-                    result.phase3_count += 1
+    def _map_batch(batch: List[FormField]) -> Dict[str, Any]:
+        # Build field list for prompt
+        field_list = "\n".join(_field_prompt_line(f) for f in batch)
 
-            logger.info(f"Phase 3 batch {batch_idx + 1}/{len(batches)}: {len(mappings)} fields from LLM")
+        prompt = FIELD_MAPPING_PROMPT.format(
+            entity_json=entity_json[:6000],  # Truncate if very large
+            field_list=field_list,
+            already_mapped_sample=mapped_sample_str[:2000],
+        )
+
+        response = llm_engine.generate(
+            prompt=prompt,
+            system=FIELD_MAPPING_SYSTEM,
+            temperature=0.0,
+        )
 
-        except Exception as e:
-            error_msg = f"Phase 3 batch {batch_idx + 1} failed: {e}"
-            logger.warning(error_msg)
-            result.errors.append(error_msg)
+        parsed = llm_engine.parse_json(response)
+        return parsed.get("mappings", {})
+
+    workers = max(1, min(max_workers, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_map_batch, batch) for batch in batches]
+
+        for batch_idx, future in enumerate(futures):
+            try:
+                mappings = future.result()
+
+                for fname, value in mappings.items():
+                    if fname in catalog.fields and value and str(value).strip():
+                        val_str = str(value).strip()
+                        # Skip "null", "N/A", "unknown" etc
+                        if val_str.lower() in ("null", "none", "n/a", "unknown", ""):
+                            continue
+                        result.mappings[fname] = val_str
+                        mapped_names.add(fname)
+                        result.phase3_count += 1
+
+                logger.info(f"Phase 3 batch {batch_idx + 1}/{len(batches)}: {len(mappings)} fields from LLM")
+
+            except Exception as e:
+                error_msg = f"Phase 3 batch {batch_idx + 1} failed: {e}"
+                logger.warning(error_msg)
+                result.errors.append(error_msg)
 
     result.unmapped_fields = [
         f.name for f in catalog.fields.values()
@@ -657,6 +704,13 @@ def map_fields(
     return result
 
 
+@lru_cache(maxsize=4096)
+def _field_prompt_line(f: FormField) -> str:
+    """Phase 3 prompt line for one field (fields from cached catalogs repeat)."""
+    tooltip_str = f": \"{f.tooltip}\"" if f.tooltip else ""
+    return f"- {f.name} ({f.field_type}){tooltip_str}"
+
+
 def _create_batches(fields: List[FormField], batch_size: int) -> List[List[FormField]]:
     """Create batches grouped by category for better LLM context."""
     # Sort by category to group related fields
@@ -823,7 +877,7 @@ def map_all(
     Returns:
         Dict of form_number -> {field_name: value}
     """
-    from Custom_model_fa_pf.form_reader import find_template, read_pdf_form
+    from Custom_model_fa_pf.form_reader import find_template, read_template_catalog
 
     all_mappings: Dict[str, Dict[str, str]] = {}
 
@@ -846,7 +900,7 @@ def map_all(
             if not template_path:
                 logger.warning(f"Form {form_num}: no template PDF found, skipping")
                 continue
-            catalog = read_pdf_form(template_path)
+            catalog = read_template_catalog(template_path)
 
         if not catalog.fields:
             logger.warning(f"Form {form_num}: no fields found in catalog")
@@ -1,6 +1,5 @@
 """Pipeline orchestrator: email → classified LOBs → extracted entities → pre-filled PDFs."""
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -199,43 +198,52 @@ def run(
 
 
 def _save_results(result: PipelineResult, output_dir: Path):
-    """Save all results as JSON files."""
+    """Save all results as JSON files.
+
+    The submission dict is built once and its sections reused for the
+    per-stage files, then each is written indented with the shared root JSON
+    encoder (None-valued entity fields are already dropped by to_dict).
+    """
+    from utils import encode_json
+
+    submission = result.to_dict()
+
     # Full submission
-    with open(output_dir / "submission.json", "w") as f:
-        json.dump(result.to_dict(), f, indent=2, default=str)
+    (output_dir / "submission.json").write_bytes(encode_json(submission, indent=2))
 
     # Classification
-    with open(output_dir / "classification.json", "w") as f:
-        json.dump([l.to_dict() for l in result.lobs], f, indent=2)
+    (output_dir / "classification.json").write_bytes(encode_json(submission["lobs"], indent=2))
 
     # Extracted entities
     if result.entities:
-        with open(output_dir / "extracted_entities.json", "w") as f:
-            json.dump(result.entities.to_dict(), f, indent=2)
+        (output_dir / "extracted_entities.json").write_bytes(
+            encode_json(submission["entities"], indent=2)
+        )
 
     # Form assignments
-    with open(output_dir / "form_assignments.json", "w") as f:
-        json.dump([a.to_dict() for a in result.assignments], f, indent=2)
+    (output_dir / "form_assignments.json").write_bytes(
+        encode_json(submission["assignments"], indent=2)
+    )
 
     # Field mappings per form
     mappings_dir = output_dir / "field_mappings"
     mappings_dir.mkdir(exist_ok=True)
     for form_num, fields in result.field_values.items():
-        with open(mappings_dir / f"form_{form_num}.json", "w") as f:
-            json.dump(fields, f, indent=2)
+        (mappings_dir / f"form_{form_num}.json").write_bytes(
+            encode_json({k: v for k, v in fields.items() if v is not None}, indent=2)
+        )
 
     # Validation results
     if result.validation_results:
-        with open(output_dir / "validation_results.json", "w") as f:
-            json.dump(
-                {k: v.to_dict() for k, v in result.validation_results.items()},
-                f, indent=2,
-            )
+        (output_dir / "validation_results.json").write_bytes(
+            encode_json(submission["validation_results"], indent=2)
+        )
 
     # Gap report
     if result.gap_report:
-        with open(output_dir / "gap_report.json", "w") as f:
-            json.dump(result.gap_report.to_dict(), f, indent=2)
+        (output_dir / "gap_report.json").write_bytes(
+            encode_json(submission["gap_report"], indent=2)
+        )
 
     logger.info(f"Results saved to {output_dir}")
 
@@ -39,3 +39,15 @@ def test_turn_limits():
     assert MAX_CONVERSATION_TURNS > 0
     assert MAX_TOOL_CALLS_PER_TURN > 0
     assert SUMMARIZE_AFTER_TURNS > 0
+
+
+def test_field_mapper_workers_default_sequential(monkeypatch):
+    import importlib
+    from Custom_model_fa_pf import config
+
+    monkeypatch.delenv("FIELD_MAPPER_LLM_WORKERS", raising=False)
+    assert importlib.reload(config).LLM_MAX_WORKERS == 1
+    monkeypatch.setenv("FIELD_MAPPER_LLM_WORKERS", "4")
+    assert importlib.reload(config).LLM_MAX_WORKERS == 4
+    monkeypatch.delenv("FIELD_MAPPER_LLM_WORKERS")
+    importlib.reload(config)  # leave the module as other tests imported it
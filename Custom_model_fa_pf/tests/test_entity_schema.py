@@ -4,7 +4,7 @@ import pytest
 from Custom_model_fa_pf.entity_schema import (
     CustomerSubmission, BusinessInfo, Address, VehicleInfo,
     DriverInfo, CoverageRequest, AdditionalInterest,
-    PriorInsurance, CyberInfo, _normalize_entity_type,
+    PriorInsurance, CyberInfo, SubmissionDict, _normalize_entity_type,
 )
 
 
@@ -119,6 +119,36 @@ class TestCustomerSubmissionExpanded:
         assert "prior_insurance" in d
         assert "cyber_info" in d
 
+    def test_submission_dict_matches_dataclasses(self):
+        import dataclasses
+        from Custom_model_fa_pf import entity_schema
+
+        sub_fields = {f.name for f in dataclasses.fields(CustomerSubmission)}
+        assert set(SubmissionDict.__annotations__) == sub_fields - {"raw_email"}
+        entity_classes = [
+            obj for name, obj in vars(entity_schema).items()
+            if dataclasses.is_dataclass(obj) and obj.__module__ == entity_schema.__name__
+            and obj is not CustomerSubmission
+        ]
+        assert len(entity_classes) == 13
+        for cls in entity_classes:
+            td = getattr(entity_schema, f"{cls.__name__}Dict")
+            assert set(td.__annotations__) == {f.name for f in dataclasses.fields(cls)}, cls.__name__
+
+
+class TestSlottedEntities:
+    def test_no_instance_dict(self):
+        driver = DriverInfo(full_name="Jane Doe", dob="01/02/1980")
+        assert not hasattr(driver, "__dict__")
+        with pytest.raises(AttributeError):
+            driver.nickname = "JD"
+
+    def test_to_dict_keeps_field_order_and_skips_none(self):
+        vehicle = VehicleInfo(vin="1HGCM82633A004352", year="2020",
+                              garaging_address=Address(city="Austin"))
+        assert list(vehicle.to_dict()) == ["vin", "year", "garaging_address"]
+        assert vehicle.to_dict()["garaging_address"] == {"city": "Austin"}
+
 
 class TestEntityTypeNormalization:
     def test_corp_normalized(self):
@@ -6,7 +6,7 @@ from Custom_model_fa_pf.entity_schema import (
     PolicyInfo, VehicleInfo, DriverInfo, CoverageRequest, Contact,
 )
 from Custom_model_fa_pf.form_assigner import FormAssignment
-from Custom_model_fa_pf.field_mapper import map_all
+from Custom_model_fa_pf.field_mapper import _field_map_module, map_all
 
 
 def _make_submission() -> CustomerSubmission:
@@ -251,6 +251,36 @@ class TestFieldMapper:
         # Should not have empty address fields
         assert "NamedInsured_MailingAddress_CityName_A" not in f125
 
+    def test_additional_interest_type_checkboxes(self):
+        from Custom_model_fa_pf.entity_schema import AdditionalInterest
+
+        sub = CustomerSubmission(additional_interests=[
+            AdditionalInterest(name="First Bank", interest_type="Lienholder"),
+            AdditionalInterest(name="Second Bank", interest_type="mortgagee"),
+        ])
+        f125 = map_all(sub, _make_assignments(["125"]))["125"]
+        assert f125["AdditionalInterest_Interest_LienholderIndicator_A"] == "1"
+        assert f125["AdditionalInterest_Interest_MortgageeIndicator_B"] == "1"
+        assert "AdditionalInterest_Interest_MortgageeIndicator_A" not in f125
+
+    def test_field_map_modules_load_on_demand(self):
+        from Custom_model_fa_pf.field_maps import form_127
+
+        assert _field_map_module("127") is form_127
+        assert _field_map_module("999") is None
+
+    def test_schema_registry_drops_unknown_names(self):
+        from schema_registry import SchemaRegistry
+        from Custom_model_fa_pf.config import SCHEMAS_DIR
+
+        registry = SchemaRegistry(schemas_dir=SCHEMAS_DIR)
+        mappings = map_all(_make_submission(), _make_assignments(["125"]), schema_registry=registry)
+        f125 = mappings["125"]
+        schema = registry.get_schema("125")
+        assert f125["NamedInsured_FullName_A"] == "Test Corp"
+        assert all(name in schema.fields for name in f125)
+        assert all(isinstance(v, str) and v.strip() for v in f125.values())
+
 
 class TestDriverNameHelpers:
     """Test DriverInfo.get_first_name() and get_last_name() helpers."""
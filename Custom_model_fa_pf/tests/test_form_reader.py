@@ -50,6 +50,15 @@ class TestFormField:
         assert d["base_name"] == "Driver_GivenName"
         assert d["rect"] == [100.0, 200.0, 300.0, 220.0]
 
+    def test_frozen_and_hashable(self):
+        from dataclasses import FrozenInstanceError
+
+        f = FormField(name="Driver_GivenName_A", field_type="text", rect=(1.0, 2.0, 3.0, 4.0))
+        assert f == FormField(name="Driver_GivenName_A", field_type="text", rect=(1.0, 2.0, 3.0, 4.0))
+        assert len({f, FormField(name="Driver_GivenName_A", field_type="text", rect=(1.0, 2.0, 3.0, 4.0))}) == 1
+        with pytest.raises(FrozenInstanceError):
+            f.tooltip = "changed"
+
 
 class TestCategoryInference:
     def test_driver_prefix(self):
@@ -216,3 +225,62 @@ class TestReadTemplates:
         fields_with_tooltips = catalog.get_fields_with_tooltips()
         # We expect a good percentage to have tooltips
         assert len(fields_with_tooltips) > 0
+
+
+class TestTemplateCatalogCache:
+    def test_reads_each_template_version_once(self, tmp_path, monkeypatch):
+        import os
+        from Custom_model_fa_pf import form_reader
+
+        pdf = tmp_path / "acord_999.pdf"
+        pdf.write_bytes(b"%PDF-1.4 v1")
+        calls = []
+
+        def fake_read(path, scale_dpi=300):
+            calls.append(path)
+            catalog = FormCatalog(pdf_path=str(path))
+            catalog.fields["f1"] = FormField(name="f1", field_type="text")
+            return catalog
+
+        monkeypatch.setattr(form_reader, "read_pdf_form", fake_read)
+        monkeypatch.setattr(form_reader, "_CATALOG_CACHE", {})
+        first = form_reader.read_template_catalog(pdf)
+        assert form_reader.read_template_catalog(pdf) is first
+        assert len(calls) == 1
+
+        pdf.write_bytes(b"%PDF-1.4 version 2")
+        os.utime(pdf, ns=(1, 1))
+        assert form_reader.read_template_catalog(pdf) is not first
+        assert len(calls) == 2
+
+
+class TestFormCatalogLRU:
+    def test_caches_per_version_and_stays_bounded(self, tmp_path, monkeypatch):
+        import os
+        from Custom_model_fa_pf import form_reader
+
+        calls = []
+
+        def fake_read(path, scale_dpi=300):
+            calls.append(path)
+            return FormCatalog(pdf_path=str(path))
+
+        monkeypatch.setattr(form_reader, "read_pdf_form", fake_read)
+        form_reader._read_catalog_version.cache_clear()
+        pdf = tmp_path / "upload.pdf"
+        pdf.write_bytes(b"%PDF-1.4 v1")
+        first = form_reader.read_form_catalog(pdf)
+        assert form_reader.read_form_catalog(pdf) is first
+        assert len(calls) == 1
+
+        pdf.write_bytes(b"%PDF-1.4 version 2")
+        os.utime(pdf, ns=(1, 1))
+        assert form_reader.read_form_catalog(pdf) is not first
+
+        for i in range(form_reader.FORM_CATALOG_CACHE_SIZE + 5):
+            other = tmp_path / f"doc_{i}.pdf"
+            other.write_bytes(b"%PDF-1.4")
+            form_reader.read_form_catalog(other)
+        info = form_reader._read_catalog_version.cache_info()
+        assert info.currsize == form_reader.FORM_CATALOG_CACHE_SIZE
+        form_reader._read_catalog_version.cache_clear()
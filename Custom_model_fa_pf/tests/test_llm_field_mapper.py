@@ -115,13 +115,16 @@ def _make_catalog(fields_dict: dict) -> FormCatalog:
     """Create a FormCatalog from a simple {name: type} dict."""
     catalog = FormCatalog(pdf_path="test.pdf")
     for name, ftype in fields_dict.items():
-        ff = FormField(name=name, field_type=ftype)
         # Infer suffix and base_name
         import re
         match = re.search(r"_([A-M]|\d+)$", name)
         if match:
-            ff.suffix = match.group(0)
-            ff.base_name = name[:match.start()]
+            ff = FormField(
+                name=name, field_type=ftype,
+                suffix=match.group(0), base_name=name[:match.start()],
+            )
+        else:
+            ff = FormField(name=name, field_type=ftype)
         catalog.fields[name] = ff
     catalog.total_fields = len(catalog.fields)
     return catalog
@@ -289,6 +292,16 @@ class TestResolveIndexedField:
         result = _resolve_indexed_field(sub, "Vehicle_CostNewAmount", 0, "vehicles", _VEHICLE_FIELD_MAP)
         assert result == "55000"
 
+    def test_generated_address_fields(self):
+        assert _DRIVER_FIELD_MAP["Driver_MailingAddress_PostalCode"] == "mailing_address.zip_code"
+        assert _VEHICLE_FIELD_MAP["Vehicle_Garaging_StateOrProvinceCode"] == "garaging_address.state"
+        sub = _make_submission()
+        sub.vehicles[0].garaging_address = Address(city="Peoria")
+        result = _resolve_indexed_field(
+            sub, "Vehicle_PhysicalAddress_CityName", 0, "vehicles", _VEHICLE_FIELD_MAP
+        )
+        assert result == "Peoria"
+
 
 class TestSuffixIndex:
     def test_all_letters(self):
@@ -481,6 +494,39 @@ class TestMapFieldsPhase1And2:
         assert result.total_mapped == 0
 
 
+class _BatchEchoLLM:
+    """Fake LLM engine: maps every field listed in the prompt to "v:<name>"."""
+
+    def generate(self, prompt, system=None, temperature=0.0):
+        names = [line[2:].split(" (")[0] for line in prompt.splitlines() if line.startswith("- Custom_")]
+        if "Custom_Fail_0" in names:
+            raise RuntimeError("boom")
+        return names
+
+    def parse_json(self, names):
+        return {"mappings": {n: f"v:{n}" for n in names}}
+
+
+class TestMapFieldsPhase3:
+    def test_concurrent_batches_merge_in_order(self, monkeypatch):
+        import Custom_model_fa_pf.llm_field_mapper as mapper
+        monkeypatch.setattr(mapper, "LLM_BATCH_SIZE", 2)
+        catalog = _make_catalog({f"Custom_Field_{i}": "text" for i in range(5)})
+        result = map_fields(_make_submission(), catalog, llm_engine=_BatchEchoLLM(), max_workers=3)
+        assert result.phase3_count == 5
+        assert list(result.mappings) == [f"Custom_Field_{i}" for i in range(5)]
+        assert result.mappings["Custom_Field_3"] == "v:Custom_Field_3"
+
+    def test_failed_batch_is_recorded(self, monkeypatch):
+        import Custom_model_fa_pf.llm_field_mapper as mapper
+        monkeypatch.setattr(mapper, "LLM_BATCH_SIZE", 1)
+        catalog = _make_catalog({"Custom_Fail_0": "text", "Custom_Field_1": "text"})
+        result = map_fields(_make_submission(), catalog, llm_engine=_BatchEchoLLM())
+        assert result.mappings == {"Custom_Field_1": "v:Custom_Field_1"}
+        assert len(result.errors) == 1 and "boom" in result.errors[0]
+        assert result.unmapped_fields == ["Custom_Fail_0"]
+
+
 class TestMappingResult:
     def test_total_mapped(self):
         r = MappingResult()
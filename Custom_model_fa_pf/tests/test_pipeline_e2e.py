@@ -92,3 +92,27 @@ class TestPipelineE2E:
         # Should have vehicles and drivers
         assert len(ent.vehicles) >= 1
         assert len(ent.drivers) >= 1
+
+
+class TestSaveResults:
+    def test_writes_submission_sections(self, tmp_path):
+        import json
+
+        from Custom_model_fa_pf.entity_schema import BusinessInfo, CustomerSubmission
+        from Custom_model_fa_pf.pipeline import PipelineResult, _save_results
+
+        result = PipelineResult(
+            entities=CustomerSubmission(business=BusinessInfo(business_name="Acme LLC")),
+            field_values={"125": {"NamedInsured_FullName_A": "Acme LLC", "Policy_Number_A": None}},
+        )
+        _save_results(result, tmp_path)
+
+        raw = (tmp_path / "submission.json").read_bytes()
+        assert raw.startswith(b'{\n  "')  # indented for people reading the run output
+        submission = json.loads(raw)
+        entities = json.loads((tmp_path / "extracted_entities.json").read_bytes())
+        assert entities == submission["entities"]
+        assert entities["business"]["business_name"] == "Acme LLC"
+        mapping = json.loads((tmp_path / "field_mappings" / "form_125.json").read_bytes())
+        assert mapping == {"NamedInsured_FullName_A": "Acme LLC"}
+        assert not (tmp_path / "gap_report.json").exists()
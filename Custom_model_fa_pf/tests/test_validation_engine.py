@@ -87,6 +87,10 @@ class TestDateParsing:
     def test_empty(self):
         assert _parse_date("") is None
 
+    def test_shares_root_parser(self):
+        import field_validator
+        assert _parse_date is field_validator._parse_date
+
 
 class TestValidateVIN:
     def test_vin_length_error(self):
@@ -22,13 +22,23 @@ from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Reuse state/ZIP table from field_validator
+# Reuse state/ZIP table, VIN checksum and date parsing from field_validator
 try:
-    from field_validator import STATE_ZIP_PREFIXES, _validate_vin_checksum
+    from field_validator import STATE_ZIP_PREFIXES, _parse_date, _validate_vin_checksum
 except ImportError:
     # Fallback if field_validator not on path
     STATE_ZIP_PREFIXES = {}
 
+    def _parse_date(value: str) -> Optional[date]:
+        if not value or not isinstance(value, str):
+            return None
+        for fmt in ("%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%m/%d/%y", "%m-%d-%y"):
+            try:
+                return datetime.strptime(value.strip(), fmt).date()
+            except ValueError:
+                continue
+        return None
+
     def _validate_vin_checksum(vin: str) -> bool:
         vin = vin.strip().upper()
         if len(vin) != 17:
@@ -43,10 +53,10 @@ except ImportError:
         for i, char in enumerate(vin):
             if char.isdigit():
                 val = int(char)
-            elif char in transliteration:
-                val = transliteration[char]
             else:
-                return True
+                val = transliteration.get(char)
+                if val is None:
+                    return True
             total += val * weights[i]
         remainder = total % 11
         check_digit = 'X' if remainder == 10 else str(remainder)
@@ -169,18 +179,6 @@ def _extract_digits(value: str) -> str:
     return re.sub(r"[^\d]", "", str(value))
 
 
-def _parse_date(value: str) -> Optional[date]:
-    if not value or not isinstance(value, str):
-        return None
-    value = value.strip()
-    for fmt in ("%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%m/%d/%y", "%m-%d-%y"):
-        try:
-            return datetime.strptime(value, fmt).date()
-        except ValueError:
-            continue
-    return None
-
-
 def _normalize_phone(phone: str) -> Optional[str]:
     """Normalize phone number to (XXX) XXX-XXXX format."""
     digits = _extract_digits(phone)
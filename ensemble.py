@@ -78,7 +78,7 @@ FIELD_TYPE_WEIGHTS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceResult:
     """A single field value from one source."""
     value: Any
@@ -86,7 +86,7 @@ class SourceResult:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldFusion:
     """Fusion result for one field."""
     final_value: Any
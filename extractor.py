@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import re
 import time
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -94,9 +95,10 @@ except ImportError:
 
 # Optional: Label field map (pre-built label→field lookup)
 try:
-    from label_field_map import LabelFieldMap
+    from label_field_map import LabelFieldMap, get_label_field_map
 except ImportError:
     LabelFieldMap = None  # type: ignore
+    get_label_field_map = None  # type: ignore
 
 # Optional: Image alignment
 try:
@@ -137,6 +139,20 @@ except ImportError:
     VISION_UTILS_AVAILABLE = False
 
 
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+@lru_cache(maxsize=4096)
+def _norm_field_key(key: str) -> str:
+    """Comparison form of a field key: spaces/dashes/slashes → "_", runs collapsed, lowercase.
+
+    Cached: schema keys are re-normalised for every VLM key in every batch,
+    and VLM responses repeat the same keys across pages and documents.
+    """
+    norm = key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
+    return _UNDERSCORE_RUN_RE.sub("_", norm).strip("_")
+
+
 class ACORDExtractor:
     """
     High-accuracy extraction pipeline for scanned ACORD forms.
@@ -533,7 +549,7 @@ class ACORDExtractor:
             if cache_key not in self._semantic_matcher_cache:
                 try:
                     self._semantic_matcher_cache[cache_key] = SemanticFieldMatcher(schema)
-                    print(f"  [SEMANTIC] MiniLM matcher initialized for form {form_type}")
+                    print(f"  [SEMANTIC] MiniLM matcher ready for form {form_type} (model loads on first use)")
                 except Exception as e:
                     print(f"  [SEMANTIC] Failed to initialize: {e}")
             semantic_matcher = self._semantic_matcher_cache.get(cache_key)
@@ -542,7 +558,7 @@ class ACORDExtractor:
         label_map_obj = None
         if LabelFieldMap is not None:
             try:
-                label_map_obj = LabelFieldMap(form_type)
+                label_map_obj = get_label_field_map(form_type)
                 if label_map_obj.is_loaded:
                     print(f"  [LABEL-MAP] Loaded {label_map_obj.total_labels} label mappings for form {form_type}")
                 else:
@@ -1320,7 +1336,10 @@ class ACORDExtractor:
         field_types = {}
         if schema:
             for fname, finfo in schema.fields.items():
-                field_types[fname] = getattr(finfo, "field_type", "text") or "text"
+                if finfo.kind == "yes_no":
+                    field_types[fname] = "yes_no"
+                else:
+                    field_types[fname] = getattr(finfo, "field_type", "text") or "text"
         if field_types:
             extracted = normalizer_all(extracted, field_types)
 
@@ -1577,13 +1596,12 @@ class ACORDExtractor:
         to keep LLM context focused and JSON template manageable.
         """
         BATCH_SIZE = 50  # 50 = fewer round-trips; safe on 24GB. Use 30 on low memory.
-        tooltips = self.registry.get_tooltips(form_type, field_names)
         result: Dict[str, Any] = {}
 
         # --- Pass 1: Extract in batches ---
         for i in range(0, len(field_names), BATCH_SIZE):
             batch = field_names[i:i + BATCH_SIZE]
-            batch_tooltips = {k: v for k, v in tooltips.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
 
             few_shot = self._get_knowledge_context(form_type, category, batch)
             if self.rag_store is not None:
@@ -1615,7 +1633,7 @@ class ACORDExtractor:
         if missing and len(missing) >= GAP_FILL_THRESHOLD and len(missing) < len(field_names):
             for i in range(0, len(missing), BATCH_SIZE):
                 gap_batch = missing[i:i + BATCH_SIZE]
-                gap_tooltips = {k: v for k, v in tooltips.items() if k in gap_batch}
+                gap_tooltips = self.registry.get_tooltips(form_type, gap_batch)
                 gap_few_shot = self._get_knowledge_context(form_type, category, gap_batch)
                 if self.rag_store is not None:
                     gap_few_shot += self.rag_store.retrieve_for_fields(form_type, gap_batch, k=2)
@@ -1649,17 +1667,14 @@ class ACORDExtractor:
         """
         if vlm_key in batch_keys:
             return vlm_key
-        vlm_norm = vlm_key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-        vlm_norm = re.sub(r"_+", "_", vlm_norm).strip("_")
-        for b in batch_keys:
-            b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            b_norm = re.sub(r"_+", "_", b_norm).strip("_")
+        # Normalise: spaces, dashes, slashes -> underscores (VLM may return "Location/Building_Occupancy_A")
+        vlm_norm = _norm_field_key(vlm_key)
+        normed = [(b, _norm_field_key(b)) for b in batch_keys]
+        for b, b_norm in normed:
             if b_norm == vlm_norm:
                 return b
-        # Fuzzy: one key contains the other
-        for b in batch_keys:
-            b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            b_norm = re.sub(r"_+", "_", b_norm).strip("_")
+        # Fuzzy: one key contains the other (handles AuthorizedRep vs AuthorizedRepresentative)
+        for b, b_norm in normed:
             if len(b_norm) < 5:
                 continue
             if vlm_norm in b_norm or b_norm in vlm_norm:
@@ -1762,7 +1777,6 @@ class ACORDExtractor:
             return result
 
         num_pages = len(paths)
-        tooltips_all = self.registry.get_tooltips(form_type, list(all_field_names))
 
         # Build checkbox set for normalisation
         checkbox_field_set = set()
@@ -1847,7 +1861,7 @@ class ACORDExtractor:
 
                     for ci in range(0, len(group_fields), VLM_BATCH_SIZE):
                         chunk = group_fields[ci:ci + VLM_BATCH_SIZE]
-                        chunk_tooltips = {k: v for k, v in tooltips_all.items() if k in chunk}
+                        chunk_tooltips = self.registry.get_tooltips(form_type, chunk)
                         prompt = build_vlm_extract_prompt(
                             form_type=form_type,
                             categories=cats_list,
@@ -1873,7 +1887,7 @@ class ACORDExtractor:
                 for si, sfx in enumerate(sorted(driver_by_suffix.keys())):
                     sfx_fields = driver_by_suffix[sfx]
                     driver_num = ord(sfx[0].upper()) - ord('A') + 1 if sfx else 1
-                    sfx_tooltips = {k: v for k, v in tooltips_all.items() if k in sfx_fields}
+                    sfx_tooltips = self.registry.get_tooltips(form_type, sfx_fields)
 
                     # Compute row Y bounds and crop image
                     y_vals = []
@@ -1952,7 +1966,7 @@ class ACORDExtractor:
                     for row_num in sorted(rows_163.keys()):
                         row_fields = rows_163[row_num]
                         ry_min, ry_max = rows_163_bounds[row_num]
-                        row_tooltips = {k: v for k, v in tooltips_all.items() if k in row_fields}
+                        row_tooltips = self.registry.get_tooltips(form_type, row_fields)
                         cropped_path = self._crop_row_image(image_path, ry_min, ry_max)
                         prompt = build_vlm_extract_163_row_prompt(
                             row_num=row_num,
@@ -1974,7 +1988,7 @@ class ACORDExtractor:
 
                 for sfx in sorted(vehicle_by_suffix.keys()):
                     sfx_fields = vehicle_by_suffix[sfx]
-                    sfx_tooltips = {k: v for k, v in tooltips_all.items() if k in sfx_fields}
+                    sfx_tooltips = self.registry.get_tooltips(form_type, sfx_fields)
                     prompt = build_vlm_extract_vehicle_prompt(
                         form_type=form_type,
                         suffix=sfx,
@@ -2019,165 +2033,6 @@ class ACORDExtractor:
         print(f"    [VLM-EXT] {len(vlm_tasks)} VLM calls, {len(result)} fields extracted")
         return result
 
-    # ==================================================================
-    # Multimodal extraction (--multimodal: image + OCR text → JSON)
-    # ==================================================================
-
-    def _multimodal_extract_pass(
-        self,
-        form_type: str,
-        schema,
-        image_paths: List[Path],
-        extracted: Dict[str, Any],
-        field_sources: Dict[str, str],
-        CAT_PAGES: Dict[str, List[int]],
-        page_bbox_text: List[str],
-        page_docling: List[str],
-        table_markdown: str = "",
-    ) -> Dict[str, Any]:
-        """
-        Multimodal extraction: sends BOTH the page image AND OCR text to the VLM.
-
-        The VLM can cross-reference what it sees in the image with the OCR text,
-        catching errors in both. Uses the same task collection + parallel execution
-        as _vlm_extract_pass.
-        """
-        VLM_BATCH_SIZE = 25
-        result: Dict[str, Any] = {}
-        all_field_names = set(schema.fields.keys())
-        remaining = [n for n in all_field_names if n not in extracted]
-        if not remaining:
-            return result
-
-        paths = [Path(p) for p in image_paths if Path(p).exists()]
-        if not paths:
-            return result
-
-        num_pages = len(paths)
-        tooltips_all = self.registry.get_tooltips(form_type, list(all_field_names))
-
-        checkbox_field_set = set()
-        for fname, finfo in schema.fields.items():
-            if finfo.field_type in ("checkbox", "radio"):
-                checkbox_field_set.add(fname)
-
-        # Group remaining fields by page
-        fields_by_page: Dict[int, List[str]] = {}
-        for fname in remaining:
-            fi = schema.fields.get(fname)
-            if fi and fi.page is not None and fi.page < num_pages:
-                page_idx = fi.page
-            else:
-                cat = fi.category if fi else None
-                if cat and cat in CAT_PAGES:
-                    page_idx = CAT_PAGES[cat][0]
-                else:
-                    page_idx = 0
-            if page_idx not in fields_by_page:
-                fields_by_page[page_idx] = []
-            fields_by_page[page_idx].append(fname)
-
-        # Collect VLM tasks with OCR text context
-        vlm_tasks: List[Tuple[str, Path, List[str], str]] = []
-
-        for page_idx in sorted(fields_by_page.keys()):
-            page_fields = fields_by_page[page_idx]
-            if not page_fields:
-                continue
-
-            image_path = paths[page_idx] if page_idx < len(paths) else paths[0]
-
-            # Build OCR context for this page
-            ocr_context_parts = []
-            if page_idx < len(page_docling) and page_docling[page_idx]:
-                ocr_context_parts.append(page_docling[page_idx])
-            if page_idx < len(page_bbox_text) and page_bbox_text[page_idx]:
-                ocr_context_parts.append(page_bbox_text[page_idx])
-            ocr_text = "\n\n".join(ocr_context_parts)
-
-            # Group fields into categories for batching
-            from schema_registry import CATEGORY_BATCHES
-            batch_groups: Dict[int, List[str]] = {}
-            unbatched: List[str] = []
-            for fname in page_fields:
-                fi = schema.fields.get(fname)
-                cat = fi.category if fi else None
-                placed = False
-                if cat:
-                    for bi, batch_cats in enumerate(CATEGORY_BATCHES):
-                        if cat in batch_cats:
-                            if bi not in batch_groups:
-                                batch_groups[bi] = []
-                            batch_groups[bi].append(fname)
-                            placed = True
-                            break
-                if not placed:
-                    unbatched.append(fname)
-
-            if unbatched:
-                max_bi = max(batch_groups.keys()) if batch_groups else 0
-                if max_bi not in batch_groups:
-                    batch_groups[max_bi] = []
-                batch_groups[max_bi].extend(unbatched)
-
-            for bi in sorted(batch_groups.keys()):
-                group_fields = batch_groups[bi]
-                cats_in_group = set()
-                for fname in group_fields:
-                    fi = schema.fields.get(fname)
-                    if fi and fi.category:
-                        cats_in_group.add(fi.category)
-                cats_list = sorted(cats_in_group)
-
-                for ci in range(0, len(group_fields), VLM_BATCH_SIZE):
-                    chunk = group_fields[ci:ci + VLM_BATCH_SIZE]
-                    chunk_tooltips = {k: v for k, v in tooltips_all.items() if k in chunk}
-                    prompt = build_multimodal_extract_prompt(
-                        form_type=form_type,
-                        categories=cats_list,
-                        field_names=chunk,
-                        tooltips=chunk_tooltips,
-                        ocr_text=ocr_text,
-                        table_markdown=table_markdown,
-                        page_number=page_idx + 1,
-                        total_pages=num_pages,
-                    )
-                    vlm_tasks.append((prompt, image_path, chunk, f"MM p{page_idx+1}"))
-
-        if not vlm_tasks:
-            return result
-
-        mode = "parallel" if self.parallel_vlm and len(vlm_tasks) > 1 else "sequential"
-        print(f"    [MULTIMODAL] {len(vlm_tasks)} tasks ({mode})")
-
-        if self.parallel_vlm and len(vlm_tasks) > 1:
-            workers = min(self.vlm_max_workers, len(vlm_tasks))
-            with ThreadPoolExecutor(max_workers=workers) as pool:
-                futures = {
-                    pool.submit(
-                        self._exec_vlm_task, prompt, img_path, fields, checkbox_field_set, label
-                    ): label
-                    for prompt, img_path, fields, label in vlm_tasks
-                }
-                for future in as_completed(futures):
-                    task_result, is_404 = future.result()
-                    if is_404:
-                        for f in futures:
-                            f.cancel()
-                        raise VisionModelNotFoundError(self.llm.vlm_extract_model or "?")
-                    result.update(task_result)
-        else:
-            for prompt, img_path, fields, label in vlm_tasks:
-                task_result, is_404 = self._exec_vlm_task(
-                    prompt, img_path, fields, checkbox_field_set, label
-                )
-                if is_404:
-                    raise VisionModelNotFoundError(self.llm.vlm_extract_model or "?")
-                result.update(task_result)
-
-        print(f"    [MULTIMODAL] {len(vlm_tasks)} VLM calls, {len(result)} fields extracted")
-        return result
-
     # (Old _checkbox_crop_pass removed — replaced by grid montage version below)
 
     def _vision_pass_unified(
@@ -2200,27 +2055,6 @@ class ACORDExtractor:
         paths = [Path(p) for p in image_paths[:MAX_PAGES] if Path(p).exists()]
         if not paths:
             return result
-        tooltips_all = self.registry.get_tooltips(form_type, missing_fields)
-
-        def _match_key(vlm_key: str, batch_keys: List[str]) -> Optional[str]:
-            if vlm_key in batch_keys:
-                return vlm_key
-            vlm_norm = vlm_key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            vlm_norm = re.sub(r"_+", "_", vlm_norm).strip("_")
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if b_norm == vlm_norm:
-                    return b
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if len(b_norm) < 5:
-                    continue
-                if vlm_norm in b_norm or b_norm in vlm_norm:
-                    if min(len(vlm_norm), len(b_norm)) / max(len(vlm_norm), len(b_norm)) >= 0.6:
-                        return b
-            return None
 
         checkbox_field_set: Set[str] = set()
         if schema:
@@ -2230,7 +2064,7 @@ class ACORDExtractor:
 
         for i in range(0, len(missing_fields), VISION_BATCH):
             batch = missing_fields[i : i + VISION_BATCH]
-            batch_tooltips = {k: v for k, v in tooltips_all.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
             prompt = build_vision_unified_prompt(
                 form_type=form_type,
                 missing_fields=batch,
@@ -2252,7 +2086,7 @@ class ACORDExtractor:
                 for k, v in batch_result.items():
                     if v is None or (isinstance(v, str) and not v.strip()):
                         continue
-                    canonical = _match_key(k, batch)
+                    canonical = self._match_vlm_key(k, batch)
                     if canonical:
                         if canonical in checkbox_field_set:
                             result[canonical] = self._normalise_checkbox_value(v)
@@ -2284,7 +2118,6 @@ class ACORDExtractor:
         paths = [Path(p) for p in image_paths[:MAX_PAGES] if Path(p).exists()]
         if not paths:
             return result
-        tooltips_all = self.registry.get_tooltips(form_type, missing_fields)
         section_crop_paths: List[Path] = []
 
         # Form-specific section crops: when sections and output_dir exist, crop to sections
@@ -2315,30 +2148,6 @@ class ACORDExtractor:
 
         use_section_crops = bool(section_crop_paths)
 
-        def _match_key(vlm_key: str, batch_keys: List[str]) -> Optional[str]:
-            if vlm_key in batch_keys:
-                return vlm_key
-            # Normalise: spaces, dashes, slashes -> underscores (VLM may return "Location/Building_Occupancy_A")
-            vlm_norm = vlm_key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            # Collapse multiple underscores for comparison
-            vlm_norm = re.sub(r"_+", "_", vlm_norm).strip("_")
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if b_norm == vlm_norm:
-                    return b
-            # Fuzzy: one key contains the other (handles AuthorizedRep vs AuthorizedRepresentative)
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if len(b_norm) < 5:
-                    continue
-                if vlm_norm in b_norm or b_norm in vlm_norm:
-                    ratio = min(len(vlm_norm), len(b_norm)) / max(len(vlm_norm), len(b_norm))
-                    if ratio >= 0.6:
-                        return b
-            return None
-
         # Describer step removed: use full-page or section crops only (no describe-then-extract).
         use_descriptions = False
         tile_paths: List[Path] = []
@@ -2397,7 +2206,7 @@ class ACORDExtractor:
         image_paths_to_use = tile_paths if use_descriptions and tile_paths else paths
         for i in range(0, len(missing_fields), VISION_BATCH):
             batch = missing_fields[i : i + VISION_BATCH]
-            batch_tooltips = {k: v for k, v in tooltips_all.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
             if use_descriptions and region_descriptions:
                 prompt = build_vision_extraction_prompt_with_region_descriptions(
                     form_type=form_type,
@@ -2429,7 +2238,7 @@ class ACORDExtractor:
                 for k, v in batch_result.items():
                     if v is None or (isinstance(v, str) and not v.strip()):
                         continue
-                    canonical = _match_key(k, batch)
+                    canonical = self._match_vlm_key(k, batch)
                     if canonical:
                         result[canonical] = v
                         matched_this_batch += 1
@@ -2458,31 +2267,10 @@ class ACORDExtractor:
         paths = [Path(p) for p in image_paths[:MAX_PAGES] if Path(p).exists()]
         if not paths:
             return result
-        tooltips_all = self.registry.get_tooltips(form_type, missing_fields)
-
-        def _match_key(vlm_key: str, batch_keys: List[str]) -> Optional[str]:
-            if vlm_key in batch_keys:
-                return vlm_key
-            vlm_norm = vlm_key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            vlm_norm = re.sub(r"_+", "_", vlm_norm).strip("_")
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if b_norm == vlm_norm:
-                    return b
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if len(b_norm) < 5:
-                    continue
-                if vlm_norm in b_norm or b_norm in vlm_norm:
-                    if min(len(vlm_norm), len(b_norm)) / max(len(vlm_norm), len(b_norm)) >= 0.6:
-                        return b
-            return None
 
         for i in range(0, len(missing_fields), cb_batch):
             batch = missing_fields[i : i + cb_batch]
-            batch_tooltips = {k: v for k, v in tooltips_all.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
             prompt = build_vision_checkbox_prompt(
                 form_type=form_type,
                 missing_fields=batch,
@@ -2497,7 +2285,7 @@ class ACORDExtractor:
                 for k, v in batch_result.items():
                     if v is None or (isinstance(v, str) and not v.strip()):
                         continue
-                    canonical = _match_key(k, batch)
+                    canonical = self._match_vlm_key(k, batch)
                     if canonical:
                         result[canonical] = v
             except Exception as e:
@@ -2522,31 +2310,10 @@ class ACORDExtractor:
         paths = [Path(p) for p in image_paths[:MAX_PAGES] if Path(p).exists()]
         if not paths:
             return result
-        tooltips_all = self.registry.get_tooltips(form_type, missing_fields)
-
-        def _match_key(vlm_key: str, batch_keys: List[str]) -> Optional[str]:
-            if vlm_key in batch_keys:
-                return vlm_key
-            vlm_norm = vlm_key.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-            vlm_norm = re.sub(r"_+", "_", vlm_norm).strip("_")
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if b_norm == vlm_norm:
-                    return b
-            for b in batch_keys:
-                b_norm = b.strip().replace(" ", "_").replace("-", "_").replace("/", "_").lower()
-                b_norm = re.sub(r"_+", "_", b_norm).strip("_")
-                if len(b_norm) < 5:
-                    continue
-                if vlm_norm in b_norm or b_norm in vlm_norm:
-                    if min(len(vlm_norm), len(b_norm)) / max(len(vlm_norm), len(b_norm)) >= 0.6:
-                        return b
-            return None
 
         for i in range(0, len(missing_fields), drv_batch):
             batch = missing_fields[i : i + drv_batch]
-            batch_tooltips = {k: v for k, v in tooltips_all.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
             prompt = build_vision_driver_fields_prompt(
                 form_type=form_type,
                 missing_fields=batch,
@@ -2561,7 +2328,7 @@ class ACORDExtractor:
                 for k, v in batch_result.items():
                     if v is None or (isinstance(v, str) and not v.strip()):
                         continue
-                    canonical = _match_key(k, batch)
+                    canonical = self._match_vlm_key(k, batch)
                     if canonical:
                         result[canonical] = v
             except Exception as e:
@@ -2816,14 +2583,12 @@ class ACORDExtractor:
         if not missing_fields:
             return {}
 
-        tooltips = self.registry.get_tooltips(form_type, missing_fields)
-
         # Batch in groups of 30 for focused extraction
         all_result: Dict[str, Any] = {}
         batch_size = 30
         for i in range(0, len(missing_fields), batch_size):
             batch = missing_fields[i:i + batch_size]
-            batch_tooltips = {k: v for k, v in tooltips.items() if k in batch}
+            batch_tooltips = self.registry.get_tooltips(form_type, batch)
             gap_few_shot = self._get_knowledge_context(form_type, "general", batch)
             if self.rag_store is not None:
                 gap_few_shot += self.rag_store.retrieve_for_fields(form_type, batch, k=2)
@@ -3817,7 +3582,6 @@ class ACORDExtractor:
             return result
 
         num_pages = len(paths)
-        tooltips_all = self.registry.get_tooltips(form_type, list(all_field_names))
 
         # Build checkbox set for normalisation
         checkbox_field_set = set()
@@ -3901,7 +3665,7 @@ class ACORDExtractor:
                 cv2.imwrite(str(crop_path), crop)
 
                 # Build prompt for this crop
-                chunk_tooltips = {k: v for k, v in tooltips_all.items() if k in field_names}
+                chunk_tooltips = self.registry.get_tooltips(form_type, field_names)
                 prompt = build_vlm_extract_prompt(
                     form_type=form_type,
                     categories=list(set(fi.category for fi in cluster if fi.category)),
@@ -3976,7 +3740,6 @@ class ACORDExtractor:
             return result
 
         num_pages = len(paths)
-        tooltips_all = self.registry.get_tooltips(form_type, list(all_field_names))
 
         checkbox_field_set = set()
         for fname, finfo in schema.fields.items():
@@ -4053,7 +3816,7 @@ class ACORDExtractor:
 
                 for ci in range(0, len(group_fields), VLM_BATCH_SIZE):
                     chunk = group_fields[ci:ci + VLM_BATCH_SIZE]
-                    chunk_tooltips = {k: v for k, v in tooltips_all.items() if k in chunk}
+                    chunk_tooltips = self.registry.get_tooltips(form_type, chunk)
                     prompt = build_multimodal_extract_prompt(
                         form_type=form_type,
                         categories=cats_list,
@@ -4462,7 +4225,6 @@ class ACORDExtractor:
             return result
 
         num_pages = len(paths)
-        tooltips_all = self.registry.get_tooltips(form_type, list(all_field_names))
 
         # Group remaining fields by page
         fields_by_page: Dict[int, List[str]] = {}
@@ -4492,7 +4254,7 @@ class ACORDExtractor:
 
             for i in range(0, len(page_fields), BATCH_SIZE):
                 batch = page_fields[i:i + BATCH_SIZE]
-                batch_tooltips = {k: v for k, v in tooltips_all.items() if k in batch}
+                batch_tooltips = self.registry.get_tooltips(form_type, batch)
 
                 # Determine categories in this batch
                 cats_in_batch: set = set()
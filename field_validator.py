@@ -22,7 +22,9 @@ Usage:
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 # State -> ZIP prefix mapping (first 3 digits)
@@ -81,11 +83,37 @@ STATE_ZIP_PREFIXES = {
 }
 
 
+# Field-name patterns selecting which rules apply to a field. Fields matching
+# none of them are pass-through text and are never inspected.
+_RULE_PATTERNS = (
+    ("effective_date", re.compile(r"effective.*date|date.*effective|eff.*date", re.I)),
+    ("expiration_date", re.compile(r"expiration.*date|date.*expir|exp.*date", re.I)),
+    ("vehicle_year", re.compile(r"vehicle.*year|year.*model|modelyear", re.I)),
+    ("driver_dob", re.compile(r"driver.*dob|driver.*birth|dob.*driver|dateofbirth", re.I)),
+    ("vin", re.compile(r"vin|vehicle.*ident", re.I)),
+    ("phone", re.compile(r"phone|fax|telephone|tel\b", re.I)),
+    ("naic", re.compile(r"naic", re.I)),
+    ("state", re.compile(r"^(?!.*zip).*state", re.I)),
+    ("zip", re.compile(r"zip", re.I)),
+)
+
+
+@lru_cache(maxsize=None)
+def _field_rules(field_name: str) -> Tuple[str, ...]:
+    """Names of the rules that apply to a field (cached; schema names repeat)."""
+    return tuple(rule for rule, pattern in _RULE_PATTERNS if pattern.search(field_name))
+
+
 def _parse_date(value: str) -> Optional[date]:
     """Try to parse a date string in common formats."""
     if not value or not isinstance(value, str):
         return None
-    value = value.strip()
+    return _parse_date_text(value.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(value: str) -> Optional[date]:
+    """strptime over the accepted formats (cached; dates repeat across fields and forms)."""
     for fmt in ("%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%m/%d/%y", "%m-%d-%y"):
         try:
             return datetime.strptime(value, fmt).date()
@@ -116,10 +144,10 @@ def _validate_vin_checksum(vin: str) -> bool:
     for i, char in enumerate(vin):
         if char.isdigit():
             val = int(char)
-        elif char in transliteration:
-            val = transliteration[char]
         else:
-            return True  # Invalid char, can't verify
+            val = transliteration.get(char)
+            if val is None:
+                return True  # Invalid char, can't verify
         total += val * weights[i]
 
     remainder = total % 11
@@ -140,17 +168,31 @@ def validate_and_fix(
     warnings: List[str] = []
     current_year = datetime.now().year
 
+    # Bucket filled fields by the rules that apply to them; empty and
+    # pass-through fields are skipped instead of being regex-tested per rule.
+    # ZIP fields are kept whether filled or not: a state pairs with the
+    # first ZIP field sharing its prefix.
+    by_rule: Dict[str, List[str]] = defaultdict(list)
+    zip_keys: List[str] = []
+    for key, value in corrected.items():
+        rules = _field_rules(key)
+        if "zip" in rules:
+            zip_keys.append(key)
+        if value is None or value == "":
+            continue
+        for rule in rules:
+            by_rule[rule].append(key)
+
     # Collect state and ZIP fields for cross-check
     state_zip_pairs: List[Tuple[str, str]] = []
-    for key in corrected:
-        key_lower = key.lower()
-        if "state" in key_lower and "zip" not in key_lower:
-            # Find matching ZIP field (same prefix/suffix pattern)
-            prefix = key.rsplit("State", 1)[0] if "State" in key else key.rsplit("state", 1)[0]
-            for zip_key in corrected:
-                if zip_key.lower().startswith(prefix.lower()) and "zip" in zip_key.lower():
-                    state_zip_pairs.append((key, zip_key))
-                    break
+    for key in by_rule["state"]:
+        # Find matching ZIP field (same prefix/suffix pattern)
+        prefix = key.rsplit("State", 1)[0] if "State" in key else key.rsplit("state", 1)[0]
+        prefix_lower = prefix.lower()
+        for zip_key in zip_keys:
+            if zip_key.lower().startswith(prefix_lower):
+                state_zip_pairs.append((key, zip_key))
+                break
 
     # Rule 1: State <-> ZIP prefix consistency
     for state_key, zip_key in state_zip_pairs:
@@ -168,14 +210,11 @@ def validate_and_fix(
                 )
 
     # Rule 2: Date ordering (effective < expiration)
-    eff_keys = [k for k in corrected if re.search(r"effective.*date|date.*effective|eff.*date", k, re.I)]
-    exp_keys = [k for k in corrected if re.search(r"expiration.*date|date.*expir|exp.*date", k, re.I)]
-
-    for eff_key in eff_keys:
+    for eff_key in by_rule["effective_date"]:
         eff_date = _parse_date(str(corrected.get(eff_key, "")))
         if not eff_date:
             continue
-        for exp_key in exp_keys:
+        for exp_key in by_rule["expiration_date"]:
             # Match by prefix/suffix pattern
             exp_date = _parse_date(str(corrected.get(exp_key, "")))
             if exp_date and eff_date >= exp_date:
@@ -185,59 +224,54 @@ def validate_and_fix(
                 )
 
     # Rule 3: Vehicle year validation
-    for key in corrected:
-        if re.search(r"vehicle.*year|year.*model|modelyear", key, re.I):
-            year_val = _extract_digits(str(corrected[key]))
-            if year_val and len(year_val) == 4:
-                year_int = int(year_val)
-                if year_int < 1900 or year_int > current_year + 1:
-                    warnings.append(
-                        f"Vehicle year out of range: {key}={corrected[key]} "
-                        f"(expected 1900-{current_year + 1})"
-                    )
+    for key in by_rule["vehicle_year"]:
+        year_val = _extract_digits(str(corrected[key]))
+        if year_val and len(year_val) == 4:
+            year_int = int(year_val)
+            if year_int < 1900 or year_int > current_year + 1:
+                warnings.append(
+                    f"Vehicle year out of range: {key}={corrected[key]} "
+                    f"(expected 1900-{current_year + 1})"
+                )
 
     # Rule 4: Driver DOB (age >= 15)
-    for key in corrected:
-        if re.search(r"driver.*dob|driver.*birth|dob.*driver|dateofbirth", key, re.I):
-            dob = _parse_date(str(corrected[key]))
-            if dob:
-                age = (date.today() - dob).days / 365.25
-                if age < 15:
-                    warnings.append(
-                        f"Driver too young: {key}={corrected[key]} (age {age:.0f} < 15)"
-                    )
-                elif age > 120:
-                    warnings.append(
-                        f"Driver age implausible: {key}={corrected[key]} (age {age:.0f} > 120)"
-                    )
+    for key in by_rule["driver_dob"]:
+        dob = _parse_date(str(corrected[key]))
+        if dob:
+            age = (date.today() - dob).days / 365.25
+            if age < 15:
+                warnings.append(
+                    f"Driver too young: {key}={corrected[key]} (age {age:.0f} < 15)"
+                )
+            elif age > 120:
+                warnings.append(
+                    f"Driver age implausible: {key}={corrected[key]} (age {age:.0f} > 120)"
+                )
 
     # Rule 5: VIN checksum
-    for key in corrected:
-        if re.search(r"vin|vehicle.*ident", key, re.I):
-            vin_val = str(corrected[key]).strip()
-            if len(vin_val) == 17 and not _validate_vin_checksum(vin_val):
-                warnings.append(f"VIN check digit invalid: {key}={vin_val}")
+    for key in by_rule["vin"]:
+        vin_val = str(corrected[key]).strip()
+        if len(vin_val) == 17 and not _validate_vin_checksum(vin_val):
+            warnings.append(f"VIN check digit invalid: {key}={vin_val}")
 
     # Rule 6: Phone number format (should be 10 digits)
-    for key in corrected:
-        if re.search(r"phone|fax|telephone|tel\b", key, re.I):
-            phone_val = str(corrected[key]).strip()
-            digits = _extract_digits(phone_val)
-            if digits and len(digits) not in (0, 10, 11):
-                warnings.append(
-                    f"Phone number format: {key}={phone_val} "
-                    f"({len(digits)} digits, expected 10)"
-                )
+    for key in by_rule["phone"]:
+        phone_val = str(corrected[key]).strip()
+        digits = _extract_digits(phone_val)
+        if digits and len(digits) not in (0, 10, 11):
+            warnings.append(
+                f"Phone number format: {key}={phone_val} "
+                f"({len(digits)} digits, expected 10)"
+            )
 
     # Rule 7: NAIC code (exactly 5 digits)
-    for key in corrected:
-        if re.search(r"naic", key, re.I):
-            naic_val = str(corrected[key]).strip()
-            digits = _extract_digits(naic_val)
-            if digits and len(digits) != 5:
-                warnings.append(
-                    f"NAIC code format: {key}={naic_val} "
-                    f"({len(digits)} digits, expected 5)"
-                )
+    for key in by_rule["naic"]:
+        naic_val = str(corrected[key]).strip()
+        digits = _extract_digits(naic_val)
+        if digits and len(digits) != 5:
+            warnings.append(
+                f"NAIC code format: {key}={naic_val} "
+                f"({len(digits)} digits, expected 5)"
+            )
 
     return corrected, warnings
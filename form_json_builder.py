@@ -11,6 +11,9 @@ Phase 2 of the label-value → empty JSON → LLM fill pipeline.
 - Serialise/save as empty_form_125.json (etc.) for a given form type so the
   pipeline and finetuning can use a stable template.
 
+- FormBatch: column-oriented view over many filled form JSONs of one form
+  type, for bulk scans (fill rates, "how many docs have X checked").
+
 Usage:
   from schema_registry import SchemaRegistry
   from form_json_builder import build_empty_form_json, save_empty_form_json
@@ -22,11 +25,18 @@ Usage:
 from __future__ import annotations
 
 import json
+import math
 import re
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from schema_registry import SchemaRegistry, FormSchema, FieldInfo
+from field_validator import _parse_date
+from schema_registry import CHECKED_VALUES, SchemaRegistry, FormSchema, FieldInfo
+from utils import decode_json, encode_json
 
 
 def _normalize_label(s: str) -> str:
@@ -246,7 +256,12 @@ def prefill_form_json_from_ocr(
     # 3. Semantic matching pass for unmatched labels (MiniLM embeddings)
     if semantic_matcher is not None and unmatched_pairs:
         unmatched_labels = [(item.get("label") or "").strip() for item in unmatched_pairs]
-        semantic_results = semantic_matcher.batch_match(unmatched_labels)
+        try:
+            semantic_results = semantic_matcher.batch_match(unmatched_labels)
+        except Exception as e:
+            # Model is loaded lazily on first batch; a load failure skips this pass
+            print(f"  [SEMANTIC] Matching skipped: {e}")
+            semantic_results = []
         for (label, field_name, score), item in zip(semantic_results, unmatched_pairs):
             if field_name is None:
                 continue
@@ -297,15 +312,7 @@ def build_empty_form_json(
     schema = schema_registry.get_schema(form_type)
     if not schema:
         return {}
-
-    out: Dict[str, Any] = {}
-    for name in sorted(schema.fields.keys()):
-        fi = schema.fields[name]
-        if use_defaults and fi.default_value is not None and str(fi.default_value).strip():
-            out[name] = fi.default_value
-        else:
-            out[name] = None
-    return out
+    return build_empty_form_json_from_schema(schema, use_defaults=use_defaults)
 
 
 def save_empty_form_json(
@@ -321,7 +328,7 @@ def save_empty_form_json(
 
 def load_empty_form_json(path: Path) -> Dict[str, Any]:
     """Load empty form JSON from a file."""
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return decode_json(Path(path).read_bytes())
 
 
 def build_empty_form_json_from_schema(schema: FormSchema, use_defaults: bool = False) -> Dict[str, Any]:
@@ -329,16 +336,204 @@ def build_empty_form_json_from_schema(schema: FormSchema, use_defaults: bool = F
     Build empty JSON from a FormSchema instance (no registry).
     Useful when you already have the schema loaded.
     """
-    out: Dict[str, Any] = {}
-    for name in sorted(schema.fields.keys()):
-        fi = schema.fields[name]
-        if use_defaults and fi.default_value is not None and str(fi.default_value).strip():
-            out[name] = fi.default_value
-        else:
-            out[name] = None
+    out: Dict[str, Any] = dict.fromkeys(schema.field_order)
+    if use_defaults:
+        for name in schema.field_order:
+            fi = schema.fields[name]
+            if fi.default_value is not None and str(fi.default_value).strip():
+                out[name] = fi.default_value
     return out
 
 
+def form_json_bytes(schema: FormSchema, values: Dict[str, Any], exclude_none: bool = True) -> bytes:
+    """
+    Serialise a filled form dict to UTF-8 JSON in schema field order.
+
+    Walks the schema's precomputed field order instead of sorting/rebuilding the
+    dict; with exclude_none (default) the mostly-null keys are skipped.
+    Keys not in the schema are dropped.
+    """
+    if exclude_none:
+        ordered = {k: v for k in schema.field_order if (v := values.get(k)) is not None}
+    else:
+        ordered = {k: values.get(k) for k in schema.field_order}
+    return encode_json(ordered)
+
+
+def _clean_number(value: Any) -> str:
+    return str(value).strip().replace("$", "").replace(",", "").replace(" ", "")
+
+
+def _to_float(value: Any) -> float:
+    """Parse an amount/number form value to float; NaN if empty or not numeric."""
+    if value is None:
+        return math.nan
+    try:
+        return float(_clean_number(value))
+    except ValueError:
+        return math.nan
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    """Parse an amount field ("$1,250.00") to Decimal; None if empty or not numeric."""
+    if value is None:
+        return None
+    try:
+        d = Decimal(_clean_number(value))
+    except InvalidOperation:
+        return None
+    return d if d.is_finite() else None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Parse a number field ("1,200") to int; None if empty or not a whole number."""
+    if value is None:
+        return None
+    try:
+        return int(_clean_number(value))
+    except ValueError:
+        return None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Parse a date field (MM/DD/YYYY, ISO, MM/DD/YY, ...) to date; None otherwise."""
+    if value is None:
+        return None
+    return _parse_date(str(value))
+
+
+# Field kind (FieldInfo.kind) -> converter used by FormBatch.typed_column.
+# Kinds not listed (text, code, yes_no, checkbox) are returned as stored.
+KIND_CONVERTERS = {
+    "amount": _to_decimal,
+    "number": _to_int,
+    "date": _to_date,
+}
+
+
+@dataclass(slots=True)
+class FormBatch:
+    """
+    Many filled form JSONs for one form type, stored one list per schema field.
+
+    Bulk consumers (fill-rate reports, counting checked boxes across a corpus)
+    read a single column instead of visiting every per-document dict.
+    """
+    form_type: str
+    field_names: List[str] = field(default_factory=list)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    size: int = 0
+    kinds: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, schema: FormSchema, records: Iterable[Dict[str, Any]]) -> "FormBatch":
+        """Build a batch from filled form dicts; keys not in the schema are dropped."""
+        names = list(schema.field_order)
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        size = 0
+        for record in records:
+            for name in names:
+                columns[name].append(record.get(name))
+            size += 1
+        kinds = {name: schema.fields[name].kind for name in names}
+        return cls(form_type=schema.form_number, field_names=names, columns=columns, size=size, kinds=kinds)
+
+    @classmethod
+    def from_trusted(cls, schema: FormSchema, records: Iterable[Dict[str, Any]]) -> "FormBatch":
+        """
+        Build a batch from full form dicts (every schema key, nothing else).
+
+        For records produced inside the pipeline (build_empty_form_json_from_schema
+        then filled, or iter_records()): rows are read by schema key and
+        transposed in one pass, without the per-key defaulting of from_records.
+        Key order does not matter. Untrusted input goes through from_records.
+        """
+        names = list(schema.field_order)
+        rows = []
+        for record in records:
+            if len(record) != len(names):
+                raise ValueError("FormBatch.from_trusted expects exactly the schema keys in each record")
+            try:
+                rows.append(tuple(map(record.__getitem__, names)))
+            except KeyError as exc:
+                raise ValueError(f"FormBatch.from_trusted: record has no schema key {exc}") from None
+        transposed = zip(*rows) if rows else ([] for _ in names)
+        columns = {name: list(col) for name, col in zip(names, transposed)}
+        kinds = {name: schema.fields[name].kind for name in names}
+        return cls(form_type=schema.form_number, field_names=names, columns=columns, size=len(rows), kinds=kinds)
+
+    @classmethod
+    def from_json(cls, schema: FormSchema, raw: bytes) -> "FormBatch":
+        """Build a batch from a JSON array of filled form objects (raw file bytes)."""
+        records = decode_json(raw)
+        if not isinstance(records, list):
+            raise ValueError("FormBatch.from_json expects a JSON array of form objects")
+        return cls.from_records(schema, records)
+
+    def column(self, name: str) -> List[Any]:
+        """Values of one field across all documents (None where unset)."""
+        return self.columns.get(name, [None] * self.size)
+
+    def count_filled(self, name: str) -> int:
+        """Number of documents with a non-empty value for the field."""
+        return sum(1 for v in self.column(name) if v is not None and str(v).strip())
+
+    def checked_mask(self, name: str) -> int:
+        """
+        One checkbox column packed into an int: bit i is set when document i
+        has the box checked. Masks of related indicators combine with & / |.
+        """
+        mask = 0
+        for i, v in enumerate(self.column(name)):
+            if v is not None and str(v).strip().lower() in CHECKED_VALUES:
+                mask |= 1 << i
+        return mask
+
+    def count_checked(self, name: str) -> int:
+        """Number of documents with the checkbox checked."""
+        return self.checked_mask(name).bit_count()
+
+    def numeric_column(self, name: str) -> array:
+        """
+        Values of one field as a packed float64 array (NaN where unset/non-numeric).
+
+        "$1,250" → 1250.0. The array supports the buffer protocol, so numpy
+        (np.frombuffer) or numba kernels can aggregate it without per-document
+        Python objects.
+        """
+        out = array("d")
+        for v in self.column(name):
+            out.append(_to_float(v))
+        return out
+
+    def typed_column(self, name: str) -> List[Any]:
+        """
+        Values of one field converted once by its schema kind.
+
+        amount → Decimal, number → int, date → date (None where unset or
+        unparseable); other kinds are returned as stored.
+        """
+        convert = KIND_CONVERTERS.get(self.kinds.get(name, "text"))
+        column = self.column(name)
+        if convert is None:
+            return list(column)
+        return [convert(v) for v in column]
+
+    def fill_rates(self) -> Dict[str, float]:
+        """Fraction of documents with a non-empty value, per field."""
+        if not self.size:
+            return {name: 0.0 for name in self.field_names}
+        return {name: self.count_filled(name) / self.size for name in self.field_names}
+
+    def iter_records(self, exclude_none: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield one form dict per document (row view of the columns)."""
+        for i in range(self.size):
+            if exclude_none:
+                yield {n: self.columns[n][i] for n in self.field_names if self.columns[n][i] is not None}
+            else:
+                yield {n: self.columns[n][i] for n in self.field_names}
+
+
 def label_value_pairs_to_json_list(spatial_indices: list) -> list:
     """
     Convert spatial indices (from OCRResult.spatial_indices) to a list of
@@ -6,7 +6,7 @@ we flatten to flat keys with suffix _A, _B, _C so schema and comparison use the
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict
 
 # Suffix for index 1, 2, 3, ... (127 Vehicle/Driver)
 INDEX_SUFFIXES = ["_A", "_B", "_C", "_D", "_E", "_F", "_G", "_H", "_I", "_J"]
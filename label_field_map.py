@@ -6,8 +6,8 @@ Lightweight class that loads the pre-built JSON map and provides
 fast deterministic lookup at runtime.
 
 Usage:
-    from label_field_map import LabelFieldMap
-    lfm = LabelFieldMap("125")
+    from label_field_map import LabelFieldMap, get_label_field_map
+    lfm = get_label_field_map("125")   # shared; loads the JSON once per process
     result = lfm.lookup("phone", page=1, y=300, value="202-123-4567")
     # → ("Producer_ContactPerson_PhoneNumber_A", 0.92)
 
@@ -17,11 +17,14 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from utils import JSON_DECODE_ERRORS, decode_json
+
 
 # Y-region buckets (must match build_label_map.py)
 Y_REGIONS = [
@@ -46,6 +49,21 @@ def _normalise_label(s: str) -> str:
     return re.sub(r"\s+", " ", s).strip()
 
 
+def _intern_mappings(raw: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Intern labels and candidate field names from a decoded map.
+
+    Looked-up field names become keys of extraction result dicts; interned,
+    they are the same objects as the schema's (also interned) names. Keys stay
+    str-only, so don't add non-str keys to the result.
+    """
+    mappings: Dict[str, List[Dict[str, Any]]] = {}
+    for label, candidates in raw.items():
+        for c in candidates:
+            c["field_name"] = sys.intern(c["field_name"])
+        mappings[sys.intern(label)] = candidates
+    return mappings
+
+
 class LabelFieldMap:
     """
     Runtime label→field mapping lookup.
@@ -72,10 +90,10 @@ class LabelFieldMap:
         map_path = maps_dir / f"acord_{form_type}_label_map.json"
         if map_path.exists():
             try:
-                data = json.loads(map_path.read_text())
-                self._mappings = data.get("mappings", {})
+                data = decode_json(map_path.read_bytes())
+                self._mappings = _intern_mappings(data.get("mappings", {}))
                 self._loaded = True
-            except (json.JSONDecodeError, KeyError) as e:
+            except (*JSON_DECODE_ERRORS, KeyError) as e:
                 print(f"  [LABEL-MAP] Failed to load {map_path}: {e}")
 
     @property
@@ -188,3 +206,13 @@ class LabelFieldMap:
             results[field_name] = (value, confidence)
 
         return results
+
+
+@lru_cache(maxsize=None)
+def get_label_field_map(form_type: str) -> LabelFieldMap:
+    """Shared LabelFieldMap for a form type (default maps dir), loaded once per process.
+
+    The map is read-only after load. Rebuilt map files are picked up by a new
+    process, or after get_label_field_map.cache_clear().
+    """
+    return LabelFieldMap(form_type)
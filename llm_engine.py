@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import ast
 import base64
-import json
 import re
 import time
 from pathlib import Path
@@ -24,6 +23,8 @@ from typing import Any, Dict, List, Optional, Union
 
 import requests
 
+from utils import JSON_DECODE_ERRORS, decode_json
+
 try:
     from json_repair import repair_json
     JSON_REPAIR_AVAILABLE = True
@@ -755,8 +756,8 @@ class LLMEngine:
                 if not line:
                     continue
                 try:
-                    chunk = json.loads(line)
-                except json.JSONDecodeError:
+                    chunk = decode_json(line)
+                except JSON_DECODE_ERRORS:
                     continue
                 msg = chunk.get("message") or {}
                 raw = msg.get("content", "")
@@ -771,7 +772,7 @@ class LLMEngine:
                 raise VisionModelNotFoundError(model or self.vision_model or "?")
             print(f"  [VLM] Streaming fallback error: {e}")
             return ""
-        except (requests.RequestException, json.JSONDecodeError) as e:
+        except (requests.RequestException, *JSON_DECODE_ERRORS) as e:
             print(f"  [VLM] Streaming fallback error: {e}")
             return ""
         out = "".join(parts)
@@ -788,12 +789,15 @@ class LLMEngine:
         Extract a JSON object from LLM response text.
 
         Tries in order:
-          1. Direct json.loads()
+          1. Direct decode_json()
           2. Regex extraction of {...}
           3. json_repair library
           4. Python ast.literal_eval
           5. Trailing-comma removal + retry
           6. Empty dict fallback
+
+        NaN / Infinity literals are not JSON: decode_json rejects them, so
+        such output only parses if a repair step rewrites it.
         """
         if not text or not text.strip():
             return {}
@@ -807,8 +811,8 @@ class LLMEngine:
 
         # 1. Direct parse
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
+            return decode_json(cleaned)
+        except JSON_DECODE_ERRORS:
             pass
 
         # 2. Regex extraction
@@ -818,8 +822,8 @@ class LLMEngine:
             # Remove JS-style single-line comments
             candidate = re.sub(r'//.*?$', '', candidate, flags=re.MULTILINE)
             try:
-                return json.loads(candidate)
-            except json.JSONDecodeError:
+                return decode_json(candidate)
+            except JSON_DECODE_ERRORS:
                 pass
 
             # 3. json_repair
@@ -842,8 +846,8 @@ class LLMEngine:
             # 5. Trailing comma removal
             no_trailing = re.sub(r',\s*([}\]])', r'\1', candidate)
             try:
-                return json.loads(no_trailing)
-            except json.JSONDecodeError:
+                return decode_json(no_trailing)
+            except JSON_DECODE_ERRORS:
                 pass
 
         # 6. Truncated JSON: starts with { but no closing } (e.g. VLM hit token limit)
@@ -860,8 +864,8 @@ class LLMEngine:
                 # Try closing with } and then }
                 for suffix in ("}", "\n}", "}\n}"):
                     try:
-                        return json.loads(truncated + suffix)
-                    except json.JSONDecodeError:
+                        return decode_json(truncated + suffix)
+                    except JSON_DECODE_ERRORS:
                         pass
 
         # 7. Fallback
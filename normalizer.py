@@ -19,6 +19,11 @@ import re
 from typing import Any, Dict, Optional, Set
 
 
+# Exact answers a Y/N question field can carry. These come back unchanged
+# (already clean), so the label-stripping / date / money regex chain is skipped.
+YES_NO_TOKENS = frozenset({"y", "n", "yes", "no", "true", "false"})
+
+
 def normalize_all(
     extracted: Dict[str, Any],
     field_types: Dict[str, str],
@@ -29,7 +34,7 @@ def normalize_all(
 
     Args:
         extracted: {field_name: raw_value}
-        field_types: {field_name: 'text'|'checkbox'|'radio'}
+        field_types: {field_name: 'text'|'checkbox'|'radio'|'yes_no'}
         checkbox_fields: optional set of field names that are checkboxes (overrides field_types)
 
     Returns:
@@ -61,6 +66,9 @@ def normalize_value(value: Any, field_type: str, field_name: str) -> Any:
     if field_type == "checkbox":
         return normalize_checkbox(str_val)
 
+    if field_type == "yes_no" and str_val.lower() in YES_NO_TOKENS:
+        return str_val
+
     str_val = strip_label_prefixes(str_val, field_name)
 
     if is_date_field(field_name):
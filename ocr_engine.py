@@ -130,7 +130,7 @@ def cleanup_gpu_memory():
 # Data classes
 # ===========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """A block of text with spatial information from EasyOCR."""
     text: str
@@ -167,7 +167,7 @@ class TextBlock:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     """A row of horizontally-aligned text blocks."""
     blocks: List[TextBlock] = field(default_factory=list)
@@ -185,7 +185,7 @@ class Row:
         return " | ".join(b.text for b in sorted(self.blocks, key=lambda b: b.x))
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """A detected column region."""
     x_center: int
@@ -205,14 +205,14 @@ class TableRegion:
     header_row: Optional[Row] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelValuePair:
     label: TextBlock
     value: TextBlock
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DoclingTableCell:
     """A single cell from a Docling-detected table."""
     row: int
@@ -22,7 +22,7 @@ import statistics
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from schema_registry import FormSchema, FieldInfo
+from schema_registry import FormSchema
 
 
 def _compute_iou(
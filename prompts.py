@@ -14,7 +14,8 @@ Each prompt combines:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # ===========================================================================
@@ -229,6 +230,13 @@ def _json_template(field_names: List[str]) -> str:
     
     Annotates Indicator fields with comments to guide the LLM.
     """
+    return _json_template_for(tuple(field_names))
+
+
+@lru_cache(maxsize=256)
+def _json_template_for(field_names: Tuple[str, ...]) -> str:
+    # Keyed by the field tuple: the same category batches recur for every
+    # document of a form type, so each template is built once per run.
     lines = ["{"]
     for i, name in enumerate(field_names):
         comma = "," if i < len(field_names) - 1 else ""
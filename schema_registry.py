@@ -9,13 +9,17 @@ for schema-guided extraction.
 
 from __future__ import annotations
 
-import json
 import re
+import sys
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+from utils import decode_json
 
 # ===========================================================================
 # Constants
@@ -59,20 +63,49 @@ CATEGORY_BATCHES = [
 # Categories that are never batched (use specialized extraction paths)
 SPECIAL_CATEGORIES = {"driver", "vehicle", "coverage"}
 
+# Field types that hold a single on/off bit
+CHECKBOX_TYPES = ("checkbox", "radio")
+
+# Checkbox values treated as "checked" (same set the extractor normalises to "1")
+CHECKED_VALUES = frozenset({"true", "yes", "1", "on", "x", "checked", "y", "s"})
+
+# Value kinds: the handful of field shapes every schema field falls into.
+# Derived from field type + tooltip prefix ("Enter date: ...", "Enter amount: ...").
+FIELD_KINDS = ("checkbox", "yes_no", "date", "amount", "number", "code", "text")
+
+# (kind, tooltip prefixes), checked in order after checkbox
+_KIND_PREFIXES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("yes_no", ("enter y for a",)),
+    ("date", ("enter date", "date signed")),
+    ("amount", ("enter amount", "dollar amount", "enter deductible")),
+    ("number", ("enter number", "enter year", "enter percentage", "enter rate", "number of")),
+    ("code", ("enter code", "two-letter state code", "state or province code")),
+)
+
+# (kind, markers found anywhere in the tooltip), fallback after prefixes
+_KIND_MARKERS: Tuple[Tuple[str, str], ...] = (
+    ("date", "(mm/dd/yyyy)"),
+    ("amount", "amount in dollars"),
+)
+
 
 # ===========================================================================
 # Data classes
 # ===========================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldInfo:
-    """Metadata about a single form field."""
+    """Metadata about a single form field (slotted: one instance per schema field).
+
+    Frozen once loaded, so instances are hashable and safe to share/cache.
+    """
     name: str
     field_type: str        # "text", "checkbox", "radio", "dropdown", "signature"
     tooltip: Optional[str] = None
     default_value: Optional[str] = None
     category: Optional[str] = None
     suffix: Optional[str] = None
+    kind: str = "text"     # one of FIELD_KINDS (derived, not serialised)
     # Positional data (from build_field_atlas.py)
     page: Optional[int] = None
     x_min: Optional[float] = None
@@ -97,16 +130,47 @@ class FieldInfo:
             d["y_max"] = self.y_max
         return d
 
+    @classmethod
+    def from_dict(cls, fd: Dict[str, Any]) -> "FieldInfo":
+        """Build from one schema-JSON field entry; repeated strings are interned."""
+        # Positional in field-declaration order: keyword binding is a
+        # measurable share of schema load at ~600 fields per form.
+        get = fd.get
+        field_type = fd["type"]
+        tooltip = get("tooltip")
+        default_value = get("default_value")
+        return cls(
+            _intern(fd["name"]),
+            _intern(field_type),
+            _intern(tooltip),
+            _intern(default_value) if isinstance(default_value, str) else default_value,
+            _intern(get("category")),
+            _intern(get("suffix")),
+            field_kind(field_type, tooltip),
+            get("page"),
+            get("x_min"),
+            get("y_min"),
+            get("x_max"),
+            get("y_max"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class FormSchema:
-    """Full schema for one ACORD form."""
+    """Full schema for one ACORD form (slotted; derived views are cached on first use
+    and read-only, since parsed schemas are shared between registries)."""
     form_number: str
     form_name: str
     total_fields: int
     fields: Dict[str, FieldInfo] = field(default_factory=dict)
     categories: Dict[str, List[str]] = field(default_factory=dict)
     anchors: List[Dict[str, Any]] = field(default_factory=list)
+    _field_order: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _checkbox_bits: Optional[Mapping[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    _lettered_groups: Optional[Mapping[str, Tuple[str, ...]]] = field(default=None, init=False, repr=False, compare=False)
+    _row_layouts: Dict[str, Tuple[int, Tuple[Tuple[str, int, str], ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     # ----- Serialisation -----
     def to_dict(self) -> Dict[str, Any]:
@@ -129,27 +193,137 @@ class FormSchema:
             total_fields=data["total_fields"],
         )
         cats: Dict[str, List[str]] = defaultdict(list)
+        fields = schema.fields
+        make = FieldInfo.from_dict
         for name, fd in data.get("fields", {}).items():
-            fi = FieldInfo(
-                name=fd["name"],
-                field_type=fd["type"],
-                tooltip=fd.get("tooltip"),
-                default_value=fd.get("default_value"),
-                category=fd.get("category"),
-                suffix=fd.get("suffix"),
-                page=fd.get("page"),
-                x_min=fd.get("x_min"),
-                y_min=fd.get("y_min"),
-                x_max=fd.get("x_max"),
-                y_max=fd.get("y_max"),
-            )
-            schema.fields[name] = fi
-            cat = fi.category or "general"
-            cats[cat].append(name)
+            fi = make(fd)
+            name = _intern(name)
+            fields[name] = fi
+            cats[fi.category or "general"].append(name)
         schema.categories = dict(cats)
         schema.anchors = data.get("anchors", [])
         return schema
 
+    @property
+    def field_order(self) -> Tuple[str, ...]:
+        """Field names in sorted (form JSON) order, computed once."""
+        if self._field_order is None:
+            self._field_order = tuple(sorted(self.fields))
+        return self._field_order
+
+    def names_with_prefix(self, prefix: str) -> Tuple[str, ...]:
+        """Field names starting with prefix, in field order.
+
+        field_order is sorted, so matches are one contiguous slice found by
+        binary search instead of a scan over every field.
+        """
+        order = self.field_order
+        lo = bisect_left(order, prefix)
+        hi = lo
+        while hi < len(order) and order[hi].startswith(prefix):
+            hi += 1
+        return order[lo:hi]
+
+    # ----- Checkbox bitset -----
+    @property
+    def checkbox_bits(self) -> Mapping[str, int]:
+        """{checkbox field name: bit index}, in sorted field-name order."""
+        if self._checkbox_bits is None:
+            names = [n for n in self.field_order if self.fields[n].field_type in CHECKBOX_TYPES]
+            self._checkbox_bits = MappingProxyType({n: i for i, n in enumerate(names)})
+        return self._checkbox_bits
+
+    def pack_checkboxes(self, values: Dict[str, Any]) -> int:
+        """Pack checked checkbox fields of a form dict into one int (bit set = checked)."""
+        mask = 0
+        for name, bit in self.checkbox_bits.items():
+            v = values.get(name)
+            if v is not None and str(v).strip().lower() in CHECKED_VALUES:
+                mask |= 1 << bit
+        return mask
+
+    def unpack_checkboxes(self, mask: int) -> Dict[str, str]:
+        """Inverse of pack_checkboxes: {field name: "1" | "Off"} for every checkbox field."""
+        return {name: "1" if mask >> bit & 1 else "Off" for name, bit in self.checkbox_bits.items()}
+
+    def checkbox_group_mask(self, prefix: str) -> int:
+        """Bits of every checkbox whose name starts with prefix (e.g. "NamedInsured_LegalEntity_").
+
+        Group questions on a packed form become one AND:
+        ``schema.pack_checkboxes(values) & schema.checkbox_group_mask(prefix)``.
+        """
+        bits = self.checkbox_bits
+        mask = 0
+        for name in self.names_with_prefix(prefix):
+            bit = bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    # ----- Repeating rows (_A, _B, ... → list of records) -----
+    def entity_rows(self, values: Dict[str, Any], entity: str) -> List[Dict[str, Any]]:
+        """
+        View the lettered fields of one entity as a list of row dicts.
+
+        entity is the leading name component ("Driver", "CommercialStructure").
+        Row i holds suffix chr(ord("A") + i), keyed by the field name without
+        entity prefix and suffix: Driver_BirthDate_B → rows[1]["BirthDate"].
+        Rows run up to the last suffix the schema defines for the entity.
+        """
+        n_rows, layout = self._row_layout(entity)
+        rows: List[Dict[str, Any]] = [{} for _ in range(n_rows)]
+        for name, idx, attr in layout:
+            rows[idx][attr] = values.get(name)
+        return rows
+
+    def _row_layout(self, entity: str) -> Tuple[int, Tuple[Tuple[str, int, str], ...]]:
+        """(row count, ((field name, row index, row key), ...)) for entity_rows, cached per entity."""
+        cached = self._row_layouts.get(entity)
+        if cached is None:
+            prefix = entity + "_"
+            layout = []
+            for name in self.names_with_prefix(prefix):
+                base, suffix = split_suffix(name)
+                if suffix is None:
+                    continue
+                layout.append((name, ord(suffix[1]) - ord("A"), base[len(prefix):]))
+            n_rows = max((idx for _, idx, _ in layout), default=-1) + 1
+            cached = self._row_layouts[entity] = (n_rows, tuple(layout))
+        return cached
+
+    def flatten_rows(self, entity: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Inverse of entity_rows: back to flat schema keys; unknown keys are dropped."""
+        out: Dict[str, Any] = {}
+        for i, row in enumerate(rows):
+            suffix = chr(ord("A") + i)
+            for attr, value in row.items():
+                name = f"{entity}_{attr}_{suffix}"
+                if name in self.fields:
+                    out[name] = value
+        return out
+
+    # ----- Lettered families (_A, _B, ...) -----
+    @property
+    def lettered_groups(self) -> Mapping[str, Tuple[str, ...]]:
+        """
+        {base name: its lettered field names in suffix order}, computed once.
+
+        Driver_BirthDate → ("Driver_BirthDate_A", ..., "Driver_BirthDate_M").
+        Only bases with at least one lettered field are listed.
+        """
+        if self._lettered_groups is None:
+            groups: Dict[str, List[str]] = defaultdict(list)
+            for name in self.field_order:
+                base, suffix = split_suffix(name)
+                if suffix is not None:
+                    groups[base].append(name)
+            self._lettered_groups = MappingProxyType({base: tuple(names) for base, names in groups.items()})
+        return self._lettered_groups
+
+    def lettered_values(self, values: Dict[str, Any], base: str) -> List[Any]:
+        """Values of one lettered family as a list (column view): [base_A, base_B, ...]."""
+        return [values.get(name) for name in self.lettered_groups.get(base, ())]
+
     def get_positioned_fields(self, page: Optional[int] = None) -> List[FieldInfo]:
         """Return fields that have positional data. Optionally filter by page."""
         result = []
@@ -164,15 +338,37 @@ class FormSchema:
 # Registry
 # ===========================================================================
 
+# Parsed schemas shared by every SchemaRegistry in the process:
+# resolved path -> ((mtime_ns, size), schema). A registry built by main and
+# another built by the extractor reuse the same FormSchema / FieldInfo objects
+# instead of re-parsing; an edited file is re-parsed.
+_SCHEMA_CACHE: Dict[str, Tuple[Tuple[int, int], FormSchema]] = {}
+
+
+def _parse_schema_file(sf: Path) -> FormSchema:
+    st = sf.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(sf.resolve())
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    schema = FormSchema.from_dict(decode_json(sf.read_bytes()))
+    _SCHEMA_CACHE[key] = (stamp, schema)
+    return schema
+
+
 class SchemaRegistry:
     """
     Registry of ACORD field schemas for forms 125, 127, 137.
 
     Usage:
-        registry = SchemaRegistry()                 # auto-loads from schemas/
-        schema = registry.get_schema("127")
+        registry = SchemaRegistry()                 # indexes schemas/ (lazy)
+        schema = registry.get_schema("127")         # parses 127.json on first use
         fields = registry.get_fields_by_category("127", "driver")
         tooltips = registry.get_tooltips("127", field_names)
+
+    Schema files named <form>.json are only parsed the first time that form
+    is looked up, so a process handling one form never builds the others.
     """
 
     def __init__(self, schemas_dir: Optional[Path] = None):
@@ -180,6 +376,7 @@ class SchemaRegistry:
             schemas_dir = Path(__file__).parent / "schemas"
         self.schemas_dir = schemas_dir
         self.schemas: Dict[str, FormSchema] = {}
+        self._schema_paths: Dict[str, Path] = {}
         self._load_schemas()
 
     def _load_schemas(self) -> None:
@@ -187,39 +384,60 @@ class SchemaRegistry:
             print(f"Warning: schemas dir not found: {self.schemas_dir}")
             return
         for sf in self.schemas_dir.glob("*.json"):
-            try:
-                data = json.loads(sf.read_text())
-                schema = FormSchema.from_dict(data)
-                if schema.form_number in SUPPORTED_FORMS:
-                    self.schemas[schema.form_number] = schema
-                    print(f"  [Schema] ACORD {schema.form_number}: {schema.total_fields} fields")
-            except Exception as e:
-                print(f"  Warning: could not load {sf.name}: {e}")
+            if sf.stem in SUPPORTED_FORMS:
+                self._schema_paths[sf.stem] = sf
+            else:
+                # Form number not in the filename: parse now to find it
+                self._load_file(sf)
+
+    def _load_file(self, sf: Path) -> Optional[FormSchema]:
+        try:
+            schema = _parse_schema_file(sf)
+            if schema.form_number in SUPPORTED_FORMS:
+                self.schemas[schema.form_number] = schema
+                print(f"  [Schema] ACORD {schema.form_number}: {schema.total_fields} fields")
+                return schema
+        except Exception as e:
+            print(f"  Warning: could not load {sf.name}: {e}")
+        return None
+
+    def _get(self, form_number: str) -> Optional[FormSchema]:
+        s = self.schemas.get(form_number)
+        if s is None:
+            sf = self._schema_paths.pop(form_number, None)
+            if sf is not None:
+                s = self._load_file(sf)
+        return s
+
+    def load_all(self) -> None:
+        """Parse every indexed schema now (e.g. at service startup)."""
+        for form_number in list(self._schema_paths):
+            self._get(form_number)
 
     # ----- Lookups -----
 
     def get_schema(self, form_number: str) -> Optional[FormSchema]:
-        return self.schemas.get(form_number)
+        return self._get(form_number)
 
     def get_field_names(self, form_number: str) -> List[str]:
-        s = self.schemas.get(form_number)
-        return sorted(s.fields.keys()) if s else []
+        s = self._get(form_number)
+        return list(s.field_order) if s else []
 
     def get_fields_by_category(self, form_number: str, category: str) -> List[str]:
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         return s.categories.get(category, []) if s else []
 
     def get_categories(self, form_number: str) -> List[str]:
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         return sorted(s.categories.keys()) if s else []
 
     def get_field_info(self, form_number: str, field_name: str) -> Optional[FieldInfo]:
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         return s.fields.get(field_name) if s else None
 
     def get_tooltips(self, form_number: str, field_names: List[str]) -> Dict[str, str]:
         """Return {field_name: tooltip} for the given field names."""
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         if not s:
             return {}
         result: Dict[str, str] = {}
@@ -240,7 +458,7 @@ class SchemaRegistry:
 
     def get_all_fields_with_values(self, form_number: str) -> Dict[str, FieldInfo]:
         """Get all fields that have a non-empty default_value (ground truth)."""
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         if not s:
             return {}
         return {
@@ -250,7 +468,7 @@ class SchemaRegistry:
 
     def validate_field_names(self, form_number: str, extracted: Dict[str, Any]) -> Dict[str, Any]:
         """Keep only fields whose names are valid in the schema."""
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         if not s:
             return extracted
         return {k: v for k, v in extracted.items() if k in s.fields}
@@ -258,7 +476,7 @@ class SchemaRegistry:
     # ----- Prompt helpers -----
 
     def get_schema_summary(self, form_number: str) -> str:
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         if not s:
             return f"No schema for ACORD {form_number}"
         lines = [f"ACORD {s.form_number} - {s.form_name}", f"Total: {s.total_fields} fields", ""]
@@ -270,7 +488,7 @@ class SchemaRegistry:
         self, form_number: str, field_names: List[str], max_fields: int = 50
     ) -> str:
         """Format a field list with tooltips for LLM prompts."""
-        s = self.schemas.get(form_number)
+        s = self._get(form_number)
         if not s:
             return "\n".join(field_names[:max_fields])
         lines: List[str] = []
@@ -289,11 +507,41 @@ class SchemaRegistry:
 # Helpers
 # ===========================================================================
 
+def _intern(s: Optional[str]) -> Optional[str]:
+    """Intern a schema string so duplicates (e.g. _A/_B/_C tooltips) share one object."""
+    return sys.intern(s) if s else s
+
+
+@lru_cache(maxsize=None)
+def field_kind(field_type: str, tooltip: Optional[str]) -> str:
+    """Classify a field into one of FIELD_KINDS from its type and tooltip.
+
+    Cached: lettered siblings share a tooltip, so each distinct
+    (type, tooltip) pair is classified once across all loaded forms.
+    """
+    if field_type in CHECKBOX_TYPES:
+        return "checkbox"
+    tip = (tooltip or "").lower()
+    for kind, prefixes in _KIND_PREFIXES:
+        if tip.startswith(prefixes):
+            return kind
+    for kind, marker in _KIND_MARKERS:
+        if marker in tip:
+            return kind
+    return "text"
+
+
 def _extract_suffix(field_name: str) -> Optional[str]:
     m = re.search(r'_([A-Z])$', field_name)
     return f"_{m.group(1)}" if m else None
 
 
+def split_suffix(field_name: str) -> Tuple[str, Optional[str]]:
+    """Split "Driver_BirthDate_B" → ("Driver_BirthDate", "_B"); no suffix → (name, None)."""
+    suffix = _extract_suffix(field_name)
+    return (field_name[:-2], suffix) if suffix else (field_name, None)
+
+
 def detect_form_type(text: str, filename: str = "") -> Optional[str]:
     """Auto-detect ACORD form number from OCR text or filename."""
     combined = f"{filename} {text[:2000]}".lower()
@@ -17,15 +17,19 @@ Usage:
 
 from __future__ import annotations
 
+import importlib.util
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+# sentence-transformers (and torch under it) is only imported when a matcher
+# first needs its model (see warm_up); importing this module stays cheap.
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
 try:
-    from sentence_transformers import SentenceTransformer
     import numpy as np
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    np = None  # type: ignore
 
 
 # Default cosine similarity threshold for accepting a match
@@ -64,12 +68,30 @@ LABEL_ALIASES = {
 }
 
 
+_LETTER_SUFFIX_RE = re.compile(r"_[A-Z]$")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z])([A-Z])")
+
+
+@lru_cache(maxsize=4096)
+def _readable_field_name(name: str) -> str:
+    """Readable text for a schema field name (cached: every matcher built
+    for a form converts the same names)."""
+    # Remove suffix (_A, _B, etc.)
+    clean = _LETTER_SUFFIX_RE.sub("", name)
+    # Split on underscores and camelCase
+    parts = _CAMEL_BOUNDARY_RE.sub(r"\1 \2", clean)
+    parts = parts.replace("_", " ")
+    return parts.lower().strip()
+
+
 class SemanticFieldMatcher:
     """
     Matches OCR-extracted labels to schema field names using MiniLM embeddings.
 
-    Pre-computes embeddings for all schema fields (name + tooltip) at init time,
-    then matches incoming labels via cosine similarity.
+    Embeddings for all schema fields (name + tooltip) are computed once, on the
+    first match (or warm_up()), then incoming labels are matched via cosine
+    similarity. Documents whose labels all resolve without embeddings never
+    load the model.
     """
 
     def __init__(
@@ -97,25 +119,47 @@ class SemanticFieldMatcher:
         self.field_names: List[str] = []
         self.field_descriptions: List[str] = []
 
-        # Build field descriptions for embedding
+        # Build field descriptions for embedding. Lettered siblings (_A.._M)
+        # share one description object and one embedding row.
+        self._unique_descriptions: List[str] = []
+        self._description_rows: List[int] = []
+        rows: Dict[str, int] = {}
         for name, fi in schema.fields.items():
             self.field_names.append(name)
             # Combine: human-readable name + tooltip for richer semantic signal
             readable = self._field_name_to_readable(name)
             tooltip = getattr(fi, "tooltip", "") or ""
             desc = f"{readable}. {tooltip}".strip()
-            self.field_descriptions.append(desc)
+            row = rows.get(desc)
+            if row is None:
+                row = rows[desc] = len(self._unique_descriptions)
+                self._unique_descriptions.append(desc)
+            self.field_descriptions.append(self._unique_descriptions[row])
+            self._description_rows.append(row)
+
+        # Model + field embeddings are built on first match (see warm_up)
+        self._model_name = model_name
+        self._device = device
+        self._model: Any = None
+        self._field_embeddings: Any = None
+
+        # Cache for repeated labels
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+    def warm_up(self) -> None:
+        """Load the model and embed all schema fields now instead of on first match."""
+        if self._model is not None:
+            return
+        from sentence_transformers import SentenceTransformer
 
-        # Load model and pre-compute field embeddings
-        self._model = SentenceTransformer(model_name, device=device)
-        self._field_embeddings = self._model.encode(
-            self.field_descriptions,
+        model = SentenceTransformer(self._model_name, device=self._device)
+        unique_embeddings = model.encode(
+            self._unique_descriptions,
             normalize_embeddings=True,
             show_progress_bar=False,
         )
-
-        # Cache for repeated labels
-        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._field_embeddings = unique_embeddings[self._description_rows]
+        self._model = model
 
     @staticmethod
     def _field_name_to_readable(name: str) -> str:
@@ -123,12 +167,7 @@ class SemanticFieldMatcher:
 
         E.g. "Producer_FullName_A" -> "producer full name"
         """
-        # Remove suffix (_A, _B, etc.)
-        clean = re.sub(r"_[A-Z]$", "", name)
-        # Split on underscores and camelCase
-        parts = re.sub(r"([a-z])([A-Z])", r"\1 \2", clean)
-        parts = parts.replace("_", " ")
-        return parts.lower().strip()
+        return _readable_field_name(name)
 
     def _enrich_label(self, label: str) -> str:
         """Enrich a label with known aliases for better matching."""
@@ -152,9 +191,11 @@ class SemanticFieldMatcher:
             return None, 0.0
 
         cache_key = label.strip().lower()
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        self.warm_up()
         enriched = self._enrich_label(label)
         label_embedding = self._model.encode(
             [enriched],
@@ -195,9 +236,9 @@ class SemanticFieldMatcher:
         uncached_indices: List[int] = []
 
         for i, label in enumerate(labels):
-            cache_key = label.strip().lower()
-            if cache_key in self._cache:
-                field_name, score = self._cache[cache_key]
+            cached = self._cache.get(label.strip().lower())
+            if cached is not None:
+                field_name, score = cached
                 results.append((label, field_name, score))
             else:
                 results.append((label, None, 0.0))  # placeholder
@@ -205,6 +246,7 @@ class SemanticFieldMatcher:
                 uncached_indices.append(i)
 
         if uncached_labels:
+            self.warm_up()
             label_embeddings = self._model.encode(
                 uncached_labels,
                 normalize_embeddings=True,
@@ -237,6 +279,7 @@ class SemanticFieldMatcher:
         Returns:
             List of (field_name, score) sorted by score descending.
         """
+        self.warm_up()
         enriched = self._enrich_label(label)
         label_embedding = self._model.encode(
             [enriched],
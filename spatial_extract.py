@@ -21,6 +21,8 @@ This module detects and extracts:
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -1897,23 +1899,7 @@ def extract_127_drivers(page1_bbox: List[Dict]) -> Dict[str, Any]:
         parsed = _parse_driver_row(row)
 
         # Map to field names
-        field_map = {
-            "given_name": f"Driver_GivenName_{suffix}",
-            "surname": f"Driver_Surname_{suffix}",
-            "city": f"Driver_MailingAddress_CityName_{suffix}",
-            "state": f"Driver_MailingAddress_StateOrProvinceCode_{suffix}",
-            "zip": f"Driver_MailingAddress_PostalCode_{suffix}",
-            "sex": f"Driver_GenderCode_{suffix}",
-            "marital": f"Driver_MaritalStatusCode_{suffix}",
-            "dob": f"Driver_BirthDate_{suffix}",
-            "years_exp": f"Driver_ExperienceYearCount_{suffix}",
-            "year_licensed": f"Driver_LicensedYear_{suffix}",
-            "license_num": f"Driver_LicenseNumberIdentifier_{suffix}",
-            "license_state": f"Driver_LicensedStateOrProvinceCode_{suffix}",
-            "tax_id": f"Driver_TaxIdentifier_{suffix}",
-        }
-
-        for key, field_name in field_map.items():
+        for key, field_name in _driver_row_field_map(suffix):
             val = parsed.get(key)
             if val:
                 result[field_name] = val
@@ -1921,6 +1907,30 @@ def extract_127_drivers(page1_bbox: List[Dict]) -> Dict[str, Any]:
     return result
 
 
+# Parsed driver-row key -> schema base name; the driver letter is appended
+_DRIVER_ROW_FIELDS = (
+    ("given_name", "Driver_GivenName"),
+    ("surname", "Driver_Surname"),
+    ("city", "Driver_MailingAddress_CityName"),
+    ("state", "Driver_MailingAddress_StateOrProvinceCode"),
+    ("zip", "Driver_MailingAddress_PostalCode"),
+    ("sex", "Driver_GenderCode"),
+    ("marital", "Driver_MaritalStatusCode"),
+    ("dob", "Driver_BirthDate"),
+    ("years_exp", "Driver_ExperienceYearCount"),
+    ("year_licensed", "Driver_LicensedYear"),
+    ("license_num", "Driver_LicenseNumberIdentifier"),
+    ("license_state", "Driver_LicensedStateOrProvinceCode"),
+    ("tax_id", "Driver_TaxIdentifier"),
+)
+
+
+@lru_cache(maxsize=None)
+def _driver_row_field_map(suffix: str) -> Tuple[Tuple[str, str], ...]:
+    """(parsed key, field name) pairs for one driver letter, built once per letter."""
+    return tuple((key, sys.intern(f"{base}_{suffix}")) for key, base in _DRIVER_ROW_FIELDS)
+
+
 def _parse_driver_row(row: List[Dict]) -> Dict[str, str]:
     """
     Parse a single driver row into named fields using X-position ranges.
@@ -48,7 +48,7 @@ TABLE_DETECTION_THRESHOLD = 0.7
 STRUCTURE_THRESHOLD = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedCell:
     """A single cell in a detected table."""
     row: int
@@ -25,7 +25,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldRegion:
     """A template-defined region where a form field value appears."""
     field_name: str
@@ -71,7 +71,7 @@ class FieldRegion:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnchorLabel:
     """A known label position used for alignment correction."""
     text: str       # Label text to search for (e.g., "AGENCY", "CARRIER")
@@ -152,6 +152,9 @@ class TemplateRegistry:
     """
     Loads form templates from JSON files and extracts fields
     by matching template regions against OCR bbox data.
+
+    Template files are indexed at construction and only parsed the first
+    time their form is looked up (acord_<form>.json).
     """
 
     def __init__(self, templates_dir: Optional[Path] = None):
@@ -159,24 +162,35 @@ class TemplateRegistry:
             templates_dir = Path(__file__).parent / "templates"
         self.templates_dir = templates_dir
         self.templates: Dict[str, FormTemplate] = {}
+        self._template_paths: Dict[str, Path] = {}
         self._load_templates()
 
     def _load_templates(self) -> None:
         if not self.templates_dir.exists():
             return
         for tf in self.templates_dir.glob("acord_*.json"):
-            try:
-                data = json.loads(tf.read_text())
-                template = FormTemplate.from_dict(data)
-                self.templates[template.form_number] = template
-                n_regions = len(template.regions)
-                n_anchors = len(template.anchors)
-                print(f"  [Template] ACORD {template.form_number}: {n_regions} regions, {n_anchors} anchors")
-            except Exception as e:
-                print(f"  Warning: could not load template {tf.name}: {e}")
+            self._template_paths[tf.stem[len("acord_"):]] = tf
+
+    def _load_file(self, tf: Path) -> Optional[FormTemplate]:
+        try:
+            data = json.loads(tf.read_text())
+            template = FormTemplate.from_dict(data)
+            self.templates[template.form_number] = template
+            n_regions = len(template.regions)
+            n_anchors = len(template.anchors)
+            print(f"  [Template] ACORD {template.form_number}: {n_regions} regions, {n_anchors} anchors")
+            return template
+        except Exception as e:
+            print(f"  Warning: could not load template {tf.name}: {e}")
+        return None
 
     def get_template(self, form_number: str) -> Optional[FormTemplate]:
-        return self.templates.get(form_number)
+        t = self.templates.get(form_number)
+        if t is None:
+            tf = self._template_paths.pop(form_number, None)
+            if tf is not None:
+                t = self._load_file(tf)
+        return t
 
     def compute_alignment_offset(
         self,
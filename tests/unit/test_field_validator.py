@@ -0,0 +1,59 @@
+"""Unit tests for field_validator module."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from field_validator import _field_rules, _parse_date, validate_and_fix
+
+
+class TestValidateAndFix:
+    def test_pass_through_fields_have_no_rules(self):
+        assert _field_rules("NamedInsured_FullName_A") == ()
+        assert _field_rules("Producer_ContactPerson_PhoneNumber_A") == ("phone",)
+
+    def test_flags_bad_naic_and_phone(self):
+        extracted = {
+            "Insurer_NAICCode_A": "123",
+            "Producer_ContactPerson_PhoneNumber_A": "555-1234",
+            "NamedInsured_FullName_A": "Acme LLC",
+        }
+        corrected, warnings = validate_and_fix(extracted, "125")
+        assert corrected == extracted
+        assert len(warnings) == 2
+        assert any("NAIC" in w for w in warnings)
+        assert any("Phone" in w for w in warnings)
+
+    def test_empty_values_are_skipped(self):
+        extracted = {"Insurer_NAICCode_A": None, "Producer_ContactPerson_PhoneNumber_A": ""}
+        _, warnings = validate_and_fix(extracted, "125")
+        assert warnings == []
+
+    def test_date_ordering(self):
+        extracted = {
+            "Policy_EffectiveDate_A": "12/31/2025",
+            "Policy_ExpirationDate_A": "01/01/2025",
+        }
+        _, warnings = validate_and_fix(extracted, "125")
+        assert len(warnings) == 1
+        assert warnings[0].startswith("Date ordering")
+
+    def test_state_zip_mismatch(self):
+        extracted = {
+            "Location_State_A": "CA",
+            "Location_Zip_A": "10001",
+            "Mailing_State_A": "NY",
+            "Mailing_Zip_A": "10001",
+            "Billing_State_A": "CA",
+            "Billing_Zip_A": None,
+        }
+        _, warnings = validate_and_fix(extracted, "125")
+        assert len(warnings) == 1
+        assert warnings[0].startswith("State/ZIP mismatch: Location_State_A=CA")
+
+    def test_parse_date_formats(self):
+        assert _parse_date(" 12/31/2025 ") == date(2025, 12, 31)
+        assert _parse_date("2025-01-02") == date(2025, 1, 2)
+        assert _parse_date("12/31/2025") is _parse_date("12/31/2025")
+        assert _parse_date("not a date") is None
+        assert _parse_date(None) is None
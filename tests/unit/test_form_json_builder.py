@@ -0,0 +1,115 @@
+"""Unit tests for form_json_builder module."""
+
+from __future__ import annotations
+
+import json
+import math
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from form_json_builder import FormBatch, build_empty_form_json_from_schema, form_json_bytes
+from schema_registry import SchemaRegistry
+
+
+@pytest.fixture
+def schema_125(schemas_dir):
+    schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+    if schema is None:
+        pytest.skip("125 schema not found")
+    return schema
+
+
+class TestFormBatch:
+    def test_round_trip_records(self, schema_125):
+        records = [
+            {"NamedInsured_FullName_A": "Acme LLC", "NotAField": "x"},
+            {"Producer_FullName_A": "Agency Inc"},
+        ]
+        batch = FormBatch.from_records(schema_125, records)
+        assert batch.size == 2
+        rows = list(batch.iter_records(exclude_none=True))
+        assert rows == [{"NamedInsured_FullName_A": "Acme LLC"}, {"Producer_FullName_A": "Agency Inc"}]
+
+    def test_full_rows_match_empty_template_keys(self, schema_125):
+        batch = FormBatch.from_records(schema_125, [{}])
+        row = next(batch.iter_records())
+        assert row == build_empty_form_json_from_schema(schema_125)
+
+    def test_fill_rates(self, schema_125):
+        records = [{"NamedInsured_FullName_A": "Acme"}, {"NamedInsured_FullName_A": " "}]
+        batch = FormBatch.from_records(schema_125, records)
+        assert batch.count_filled("NamedInsured_FullName_A") == 1
+        assert batch.fill_rates()["NamedInsured_FullName_A"] == 0.5
+
+    def test_checked_mask_packs_checkbox_column(self, schema_125):
+        name = next(iter(schema_125.checkbox_bits))
+        batch = FormBatch.from_records(schema_125, [{name: "1"}, {name: "Off"}, {}, {name: "Yes"}])
+        assert batch.checked_mask(name) == 0b1001
+        assert batch.count_checked(name) == 2
+
+    def test_numeric_column_packs_floats(self, schema_125):
+        name = next(n for n in schema_125.field_order if schema_125.fields[n].kind == "amount")
+        batch = FormBatch.from_records(schema_125, [{name: "$1,250"}, {name: "n/a"}, {}])
+        col = batch.numeric_column(name)
+        assert col.typecode == "d"
+        assert col[0] == 1250.0
+        assert math.isnan(col[1]) and math.isnan(col[2])
+
+    def test_typed_column_converts_by_kind(self, schema_125):
+        amount = next(n for n in schema_125.field_order if schema_125.fields[n].kind == "amount")
+        when = next(n for n in schema_125.field_order if schema_125.fields[n].kind == "date")
+        text = "NamedInsured_FullName_A"
+        batch = FormBatch.from_records(
+            schema_125,
+            [{amount: "$1,250.50", when: "03/15/2024", text: "Acme"}, {amount: "n/a", when: "soon"}],
+        )
+        assert batch.typed_column(amount) == [Decimal("1250.50"), None]
+        assert batch.typed_column(when) == [date(2024, 3, 15), None]
+        assert batch.typed_column(text) == ["Acme", None]
+
+    def test_from_trusted_matches_from_records(self, schema_125):
+        filled = build_empty_form_json_from_schema(schema_125)
+        filled["NamedInsured_FullName_A"] = "Acme LLC"
+        records = [filled, build_empty_form_json_from_schema(schema_125)]
+        trusted = FormBatch.from_trusted(schema_125, records)
+        assert trusted == FormBatch.from_records(schema_125, records)
+        assert FormBatch.from_trusted(schema_125, []).size == 0
+        with pytest.raises(ValueError):
+            FormBatch.from_trusted(schema_125, [{"NamedInsured_FullName_A": "x"}])
+
+    def test_from_trusted_reads_by_key_not_position(self, schema_125):
+        filled = build_empty_form_json_from_schema(schema_125)
+        filled["NamedInsured_FullName_A"] = "Acme LLC"
+        reversed_record = dict(reversed(list(filled.items())))
+        batch = FormBatch.from_trusted(schema_125, [reversed_record])
+        assert batch.column("NamedInsured_FullName_A") == ["Acme LLC"]
+        assert batch == FormBatch.from_records(schema_125, [filled])
+        renamed = dict(filled)
+        del renamed["NamedInsured_FullName_A"]
+        renamed["NotAField"] = "x"
+        with pytest.raises(ValueError):
+            FormBatch.from_trusted(schema_125, [renamed])
+
+
+    def test_from_json_bytes(self, schema_125):
+        raw = b'[{"NamedInsured_FullName_A": "Acme LLC"}, {}]'
+        batch = FormBatch.from_json(schema_125, raw)
+        assert batch.size == 2
+        assert batch.column("NamedInsured_FullName_A") == ["Acme LLC", None]
+
+    def test_from_json_rejects_object(self, schema_125):
+        with pytest.raises(ValueError):
+            FormBatch.from_json(schema_125, b"{}")
+
+class TestFormJsonBytes:
+    def test_skips_none_and_unknown_keys_in_field_order(self, schema_125):
+        values = {"Producer_FullName_A": "Agency", "NamedInsured_FullName_A": "Acme", "Bogus": 1,
+                  "Policy_EffectiveDate_A": None}
+        out = json.loads(form_json_bytes(schema_125, values))
+        assert list(out) == ["NamedInsured_FullName_A", "Producer_FullName_A"]
+
+    def test_keep_none_matches_empty_template(self, schema_125):
+        out = json.loads(form_json_bytes(schema_125, {}, exclude_none=False))
+        assert out == build_empty_form_json_from_schema(schema_125)
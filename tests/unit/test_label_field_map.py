@@ -0,0 +1,32 @@
+"""Unit tests for label_field_map module."""
+
+from __future__ import annotations
+
+import sys
+
+from label_field_map import LabelFieldMap, get_label_field_map
+
+
+class TestLabelFieldMap:
+    def test_shared_map_is_loaded_once(self):
+        first = get_label_field_map("125")
+        assert first is get_label_field_map("125")
+        assert first.is_loaded
+
+    def test_lookup_normalises_label(self):
+        lfm = get_label_field_map("125")
+        assert lfm.lookup("  CODE: ") == lfm.lookup("code")
+        assert lfm.lookup("code") is not None
+
+    def test_labels_and_field_names_are_interned(self):
+        lfm = get_label_field_map("125")
+        label = next(iter(lfm._mappings))
+        assert type(label) is str
+        assert sys.intern(label) is label
+        field_name, _ = lfm.lookup(label)
+        assert sys.intern(field_name) is field_name
+
+    def test_missing_map_is_not_loaded(self, tmp_path):
+        lfm = LabelFieldMap("125", maps_dir=tmp_path)
+        assert not lfm.is_loaded
+        assert lfm.lookup("code") is None
@@ -62,6 +62,12 @@ class TestNormalizeValue:
         assert normalize_value("yes", "checkbox", "chk") == "1"
         assert normalize_value("no", "checkbox", "chk") == "Off"
 
+    def test_yes_no_field(self):
+        assert normalize_value(" True ", "yes_no", "Q_AACCode_A") == "True"
+        assert normalize_value("N", "yes_no", "Q_AACCode_A") == "N"
+        # Anything else goes through the general text path
+        assert normalize_value("Code: CA", "yes_no", "Q_AACCode_A") == "CA"
+
     def test_phone_field_strips_prefix(self):
         out = fix_ocr_phone("PHONE # 555-123-4567")
         assert "555" in out and "PHONE" not in out
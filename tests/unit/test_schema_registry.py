@@ -4,7 +4,15 @@ from __future__ import annotations
 
 import pytest
 
-from schema_registry import SchemaRegistry, EXTRACTION_ORDER, detect_form_type, SUPPORTED_FORMS
+from schema_registry import (
+    EXTRACTION_ORDER,
+    SUPPORTED_FORMS,
+    FieldInfo,
+    SchemaRegistry,
+    detect_form_type,
+    field_kind,
+    split_suffix,
+)
 
 
 class TestSchemaRegistry:
@@ -35,3 +43,134 @@ class TestSchemaRegistry:
     def test_detect_form_type_unknown(self):
         out = detect_form_type("Random document", "doc.pdf")
         assert out is None or out in SUPPORTED_FORMS
+
+    def test_duplicate_tooltips_share_one_object(self, schemas_dir):
+        reg = SchemaRegistry(schemas_dir=schemas_dir)
+        schema = reg.get_schema("125")
+        if schema is None:
+            pytest.skip("125 schema not found")
+        by_text = {}
+        for fi in schema.fields.values():
+            for text in (fi.tooltip, fi.default_value):
+                if text:
+                    first = by_text.setdefault(text, text)
+                    assert first is text
+
+    def test_field_info_has_no_instance_dict(self):
+        fi = FieldInfo(name="Producer_FullName_A", field_type="text")
+        assert not hasattr(fi, "__dict__")
+
+    def test_form_schema_is_slotted_and_caches_views(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+        assert not hasattr(schema, "__dict__")
+        assert schema.field_order is schema.field_order
+        assert schema.checkbox_bits is schema.checkbox_bits
+        with pytest.raises(TypeError):
+            schema.checkbox_bits["NotAField_A"] = 0
+        with pytest.raises(TypeError):
+            schema.lettered_groups["Driver_BirthDate"] = ()
+
+    def test_field_info_is_frozen_and_hashable(self):
+        fi = FieldInfo(name="Producer_FullName_A", field_type="text")
+        with pytest.raises(AttributeError):
+            fi.tooltip = "changed"
+        assert hash(fi) == hash(FieldInfo(name="Producer_FullName_A", field_type="text"))
+
+    def test_checkbox_pack_round_trip(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+        if schema is None:
+            pytest.skip("125 schema not found")
+        names = list(schema.checkbox_bits)
+        assert names, "expected checkbox fields in 125"
+        values = {names[0]: "1", names[-1]: "X", "NamedInsured_FullName_A": "1"}
+        mask = schema.pack_checkboxes(values)
+        assert bin(mask).count("1") == 2
+        unpacked = schema.unpack_checkboxes(mask)
+        assert unpacked[names[0]] == "1" and unpacked[names[-1]] == "1"
+        assert sum(v == "1" for v in unpacked.values()) == 2
+        assert "NamedInsured_FullName_A" not in unpacked
+
+    def test_names_with_prefix(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+        if schema is None:
+            pytest.skip("125 schema not found")
+        for prefix in ("NamedInsured_", "NamedInsured_LegalEntity_", "Policy_", "Zzz", ""):
+            expected = tuple(n for n in schema.field_order if n.startswith(prefix))
+            assert schema.names_with_prefix(prefix) == expected
+
+    def test_checkbox_group_mask(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+        if schema is None:
+            pytest.skip("125 schema not found")
+        group = schema.checkbox_group_mask("NamedInsured_LegalEntity_")
+        assert group.bit_count() == sum(
+            n.startswith("NamedInsured_LegalEntity_") for n in schema.checkbox_bits
+        )
+        llc = schema.pack_checkboxes({"NamedInsured_LegalEntity_LimitedLiabilityCorporationIndicator_A": "1"})
+        other = schema.pack_checkboxes({"Policy_Status_QuoteIndicator_A": "1"})
+        assert llc & group
+        assert not other & group
+
+    def test_schemas_parsed_on_first_lookup(self, schemas_dir):
+        reg = SchemaRegistry(schemas_dir=schemas_dir)
+        if "127" not in reg._schema_paths:
+            pytest.skip("127 schema not found")
+        assert "127" not in reg.schemas
+        assert reg.get_field_names("127")
+        assert "127" in reg.schemas
+
+    def test_registries_share_parsed_schema(self, schemas_dir, tmp_path):
+        assert SchemaRegistry(schemas_dir=schemas_dir).get_schema("125") is \
+            SchemaRegistry(schemas_dir=schemas_dir).get_schema("125")
+        sf = tmp_path / "125.json"
+        sf.write_bytes((schemas_dir / "125.json").read_bytes())
+        first = SchemaRegistry(schemas_dir=tmp_path).get_schema("125")
+        sf.write_bytes(sf.read_bytes() + b"\n")  # edited file is re-parsed
+        assert SchemaRegistry(schemas_dir=tmp_path).get_schema("125") is not first
+
+    def test_lettered_groups_column_view(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("127")
+        group = schema.lettered_groups["Driver_BirthDate"]
+        assert group[0] == "Driver_BirthDate_A"
+        assert list(group) == sorted(group)
+        values = {"Driver_BirthDate_A": "01/02/1980", "Driver_BirthDate_C": "03/04/1990"}
+        col = schema.lettered_values(values, "Driver_BirthDate")
+        assert col[:3] == ["01/02/1980", None, "03/04/1990"]
+        assert len(col) == len(group)
+        assert schema.lettered_values(values, "NoSuchBase") == []
+
+    def test_field_kind_from_tooltip_prefix(self):
+        assert field_kind("checkbox", "Check the box (if applicable): ...") == "checkbox"
+        assert field_kind("text", "Enter date: The effective date.  (MM/DD/YYYY) ") == "date"
+        assert field_kind("text", "Enter amount: The annual premium. ") == "amount"
+        assert field_kind("text", "Enter Y for a \u201cYes\u201d response. Input N for \u201cNo\u201d response.") == "yes_no"
+        assert field_kind("text", "Enter text: The number of units. ") == "text"
+        assert field_kind("text", None) == "text"
+
+    def test_field_kind_classifies_shared_tooltips_once(self, schemas_dir, tmp_path):
+        # Copy so the shared parse cache cannot skip classification
+        (tmp_path / "127.json").write_bytes((schemas_dir / "127.json").read_bytes())
+        field_kind.cache_clear()
+        schema = SchemaRegistry(schemas_dir=tmp_path).get_schema("127")
+        info = field_kind.cache_info()
+        assert info.hits > 0
+        assert info.currsize < len(schema.fields)
+
+    def test_split_suffix(self):
+        assert split_suffix("Driver_BirthDate_B") == ("Driver_BirthDate", "_B")
+        assert split_suffix("Vehicle_ProducerIdentifier_AA") == ("Vehicle_ProducerIdentifier_AA", None)
+
+    def test_entity_rows_round_trip(self, schemas_dir):
+        schema = SchemaRegistry(schemas_dir=schemas_dir).get_schema("127")
+        if schema is None:
+            pytest.skip("127 schema not found")
+        flat = {"Driver_BirthDate_A": "01/02/1980", "Driver_BirthDate_C": "03/04/1990"}
+        rows = schema.entity_rows(flat, "Driver")
+        assert len(rows) == 13  # drivers A-M
+        assert rows[0]["BirthDate"] == "01/02/1980"
+        assert rows[1]["BirthDate"] is None
+        assert rows[2]["BirthDate"] == "03/04/1990"
+        back = {k: v for k, v in schema.flatten_rows("Driver", rows).items() if v is not None}
+        assert back == flat
+        assert schema._row_layout("Driver") is schema._row_layout("Driver")
+        assert schema.entity_rows(flat, "NoSuchEntity") == []
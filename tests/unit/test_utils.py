@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+from datetime import date
+
 import pytest
 
-from utils import clean_json_text, prune_empty_fields, save_json, load_json
+from utils import _json_codec, clean_json_text, prune_empty_fields, save_json, load_json
 
 
 class TestCleanJsonText:
@@ -44,3 +47,37 @@ class TestSaveLoadJson:
         assert path.exists()
         loaded = load_json(path)
         assert loaded == data
+
+
+@pytest.fixture(params=["json", "msgspec"])
+def codec(request):
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    return _json_codec(request.param == "msgspec")
+
+
+class TestJsonCodec:
+    def test_decodes_bytes_and_str(self, codec):
+        decode, _, _ = codec
+        assert decode(b'{"a": [1, "\u00e9"]}') == {"a": [1, "\u00e9"]}
+        assert decode('{"a": null}') == {"a": None}
+
+    def test_malformed_input_raises_decode_errors(self, codec):
+        decode, _, errors = codec
+        for raw in (b"{", b'{"a": 1,}', b'{"a": NaN}', b"[Infinity]"):
+            with pytest.raises(errors):
+                decode(raw)
+
+    def test_encode_utf8_and_stringifies_unknown_types(self, codec):
+        decode, encode, _ = codec
+        out = encode({"name": "Caf\u00e9", "when": date(2024, 3, 15)})
+        assert isinstance(out, bytes)
+        assert "Caf\u00e9".encode("utf-8") in out
+        assert decode(out) == {"name": "Caf\u00e9", "when": "2024-03-15"}
+
+    def test_indent_matches_json_dumps(self, codec):
+        _, encode, _ = codec
+        obj = {"lobs": [{"id": "auto", "score": 0.9}], "empty": {}, "name": "Caf\u00e9"}
+        expected = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        assert encode(obj, indent=2) == expected
+        assert b"\n" not in encode(obj)
@@ -11,8 +11,14 @@ import json
 import logging
 import re
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -35,6 +41,46 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 # JSON helpers
 # ---------------------------------------------------------------------------
 
+def _reject_json_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _encode_json_stdlib(obj: Any, indent: int = 0) -> bytes:
+    text = json.dumps(obj, default=str, ensure_ascii=False, indent=indent or None)
+    return text.encode("utf-8")
+
+
+def _msgspec_encoder() -> Callable[..., bytes]:
+    encode = msgspec.json.Encoder(enc_hook=str).encode
+
+    def encode_json(obj: Any, indent: int = 0) -> bytes:
+        raw = encode(obj)
+        return msgspec.json.format(raw, indent=indent) if indent else raw
+
+    return encode_json
+
+
+def _json_codec(use_msgspec: bool) -> Tuple[Callable[..., Any], Callable[..., bytes], Tuple[type, ...]]:
+    """
+    (decode, encode, decode errors) for one backend: msgspec or stdlib json.
+
+    Both decoders take bytes or str and reject the NaN / Infinity literals
+    json.loads would otherwise accept (msgspec never does). Both encoders
+    return UTF-8 bytes, stringifying values JSON has no type for; compact
+    by default, or pretty-printed with encode(obj, indent=2).
+    """
+    if use_msgspec:
+        return msgspec.json.decode, _msgspec_encoder(), (ValueError, msgspec.DecodeError)
+    return partial(json.loads, parse_constant=_reject_json_constant), _encode_json_stdlib, (ValueError,)
+
+
+# Shared JSON codec for schema, form and LLM payloads, built once; msgspec
+# when installed. Pass raw file bytes (Path.read_bytes()) rather than
+# decoding to str first. JSON_DECODE_ERRORS is what decode_json raises on
+# malformed input.
+decode_json, encode_json, JSON_DECODE_ERRORS = _json_codec(msgspec is not None)
+
+
 def clean_json_text(text: str) -> str:
     """Strip markdown code fences and clean up LLM-produced JSON."""
     text = text.strip()
@@ -67,11 +113,10 @@ def prune_empty_fields(data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def save_json(data: Any, path: str | Path, indent: int = 2) -> None:
-    """Save data to a JSON file."""
+    """Save data to a JSON file (serialised in one shot, written with one call)."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=indent, default=str)
+    path.write_text(json.dumps(data, indent=indent, default=str), encoding="utf-8")
 
 
 def load_json(path: str | Path) -> Any:
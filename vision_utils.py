@@ -3,6 +3,8 @@
 Vision helpers: crop form page images into regions for describe-then-extract pipeline.
 Supports fixed grid (2x2) or dynamic layout-based regions from Docling/EasyOCR.
 """
+from __future__ import annotations
+
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union